@@ -9,108 +9,246 @@ Return the longest path found.
 """
 
 import sys
-from collections import defaultdict
+from array import array
 
 
 def read_graph(input_source):
-    """Read graph from input file or stdin."""
+    """
+    Read graph from input file or stdin.
+    
+    Vertex names are mapped to integer ids in order of first appearance and the
+    adjacency is returned in CSR form: the neighbours of vertex v are
+    nbrs[indptr[v]:indptr[v + 1]], with matching weights in
+    weights[indptr[v]:indptr[v + 1]].
+    """
     if isinstance(input_source, str):
-        f = open(input_source, 'r')
+        f = open(input_source, 'rb')
         should_close = True
     else:
-        f = input_source
+        # Read stdin as raw bytes when possible; text streams are encoded below
+        f = getattr(input_source, 'buffer', input_source)
         should_close = False
     
     try:
-        lines = [line.strip() for line in f if line.strip()]
+        data = f.read()
     finally:
         if should_close:
             f.close()
     
-    if not lines:
-        return set(), {}
+    # Tokenize the whole input in one call instead of splitting it line by
+    # line; only vertex names are ever decoded back to str
+    if isinstance(data, str):
+        data = data.encode()
+    tokens = data.split()
     
-    n, m = map(int, lines[0].split())
-    graph = defaultdict(dict)
-    vertices = set()
+    if not tokens:
+        return [], array('i', [0]), array('i'), array('d')
     
-    for i in range(1, min(m + 1, len(lines))):
-        if i >= len(lines):
-            break
-        parts = lines[i].split()
-        if len(parts) >= 3:
-            u, v = parts[0], parts[1]
-            w = float(parts[2])
-            vertices.add(u)
-            vertices.add(v)
-            graph[u][v] = w
-            graph[v][u] = w
-    
-    return vertices, graph
-
-
-def greedy_path_from_start(start, graph, vertices):
-    """Find a path starting from 'start' using strict greedy strategy."""
-    visited = {start}
-    path = [start]
+    n, m = int(tokens[0]), int(tokens[1])
+    ids = {}
+    edge_index = {}
+    edge_u = []
+    edge_v = []
+    edge_w = []
+    
+    end = 2 + 3 * min(m, (len(tokens) - 2) // 3)
+    for a, b, w in zip(tokens[2:end:3], tokens[3:end:3], map(float, tokens[4:end:3])):
+        u = ids.setdefault(a, len(ids))
+        v = ids.setdefault(b, len(ids))
+        if u == v:
+            continue
+        key = (u, v) if u < v else (v, u)
+        k = edge_index.get(key)
+        if k is None:
+            edge_index[key] = len(edge_w)
+            edge_u.append(u)
+            edge_v.append(v)
+            edge_w.append(w)
+        else:
+            edge_w[k] = w
+    
+    names = [name.decode() for name in ids]
+    indptr, nbrs, weights = build_csr(len(names), edge_u, edge_v, edge_w)
+    return names, indptr, nbrs, weights
+
+
+def build_csr(num_vertices, edge_u, edge_v, edge_w):
+    """
+    Build CSR adjacency arrays from an undirected edge list.
+    
+    Each row is sorted by descending weight (ties keep read order), so the
+    heaviest unvisited neighbour is simply the first unvisited one.
+    """
+    indptr = array('i', [0]) * (num_vertices + 1)
+    for u, v in zip(edge_u, edge_v):
+        indptr[u + 1] += 1
+        indptr[v + 1] += 1
+    for v in range(num_vertices):
+        indptr[v + 1] += indptr[v]
+    
+    nbrs = array('i', [0]) * indptr[num_vertices]
+    weights = array('d', [0.0]) * indptr[num_vertices]
+    fill = indptr[:num_vertices]
+    # Filling rows in descending weight order leaves every row sorted; the
+    # sort is stable, so equal weights stay in read order
+    order = sorted(range(len(edge_w)), key=edge_w.__getitem__, reverse=True)
+    for i in order:
+        u, v, w = edge_u[i], edge_v[i], edge_w[i]
+        k = fill[u]
+        nbrs[k] = v
+        weights[k] = w
+        fill[u] = k + 1
+        k = fill[v]
+        nbrs[k] = u
+        weights[k] = w
+        fill[v] = k + 1
+    
+    return indptr, nbrs, weights
+
+
+def greedy_path_from_start(start, indptr, nbrs, weights, visited, path):
+    """
+    Find a path starting from 'start' using strict greedy strategy.
+    
+    Rows are sorted by descending weight, so each step takes the first
+    unvisited neighbour in the current vertex's CSR row (the first one read
+    if ties).
+    
+    visited (all zero on entry) and path are scratch buffers owned by the
+    caller; the path is written to path[:depth] and those vertices are left
+    marked in visited.
+    
+    Returns:
+        (path_length, depth)
+    """
+    visited[start] = 1
+    path[0] = start
+    depth = 1
     current = start
     path_length = 0
     
     while True:
-        candidates = []
-        if current in graph:
-            for neighbor, weight in graph[current].items():
-                if neighbor not in visited:
-                    candidates.append((weight, neighbor))
-        
-        if not candidates:
+        for k in range(indptr[current], indptr[current + 1]):
+            if not visited[nbrs[k]]:
+                break
+        else:
             break
+        best_neighbor = nbrs[k]
+        best_weight = weights[k]
         
-        # Choose the highest weight edge (first one if ties)
-        candidates.sort(reverse=True, key=lambda x: x[0])
-        chosen_weight, chosen_neighbor = candidates[0]
-        
-        visited.add(chosen_neighbor)
-        path.append(chosen_neighbor)
-        path_length += chosen_weight
-        current = chosen_neighbor
+        visited[best_neighbor] = 1
+        path[depth] = best_neighbor
+        depth += 1
+        path_length += best_weight
+        current = best_neighbor
     
-    return path_length, path
+    return path_length, depth
 
 
-def find_longest_path_approx(vertices, graph):
-    """Find approximate longest path by trying each vertex as a start."""
-    if not vertices:
+def component_bounds(indptr, nbrs, weights):
+    """
+    Label connected components and bound the longest path inside each one.
+    
+    A simple path in a component with c vertices uses at most c - 1 of its
+    edges, so the sum of its c - 1 heaviest (positive) edges is an upper
+    bound on any path there.
+    
+    Returns:
+        component: component index of every vertex
+        bounds: upper bound on the path length for each component
+    """
+    num_vertices = len(indptr) - 1
+    component = [-1] * num_vertices
+    bounds = []
+    for root in range(num_vertices):
+        if component[root] >= 0:
+            continue
+        label = len(bounds)
+        component[root] = label
+        stack = [root]
+        size = 0
+        edge_weights = []
+        while stack:
+            u = stack.pop()
+            size += 1
+            for k in range(indptr[u], indptr[u + 1]):
+                v = nbrs[k]
+                if v > u:
+                    edge_weights.append(weights[k])
+                if component[v] < 0:
+                    component[v] = label
+                    stack.append(v)
+        edge_weights.sort(reverse=True)
+        bounds.append(sum(w for w in edge_weights[:size - 1] if w > 0))
+    return component, bounds
+
+
+def find_longest_path_approx(indptr, nbrs, weights):
+    """
+    Find approximate longest path by trying each vertex as a start.
+    
+    Starts in a component whose upper bound cannot beat the best path found
+    so far are skipped; once the best path reaches the bound of every
+    component, the search stops.
+    """
+    num_vertices = len(indptr) - 1
+    if num_vertices == 0:
         return 0, []
     
+    # Indexing an array boxes a new number on every read, so the hot loop
+    # works on plain list copies made once here
+    indptr, nbrs, weights = indptr.tolist(), nbrs.tolist(), weights.tolist()
+    
+    component, bounds = component_bounds(indptr, nbrs, weights)
+    overall_bound = max(bounds)
+    
+    # Scratch buffers shared by every greedy run; only the entries a run
+    # touched are cleared afterwards
+    visited = bytearray(num_vertices)
+    path = [0] * num_vertices
+    
     max_length = 0
     best_path = []
     
     # Try each vertex as a starting point
-    for start in vertices:
-        path_length, path = greedy_path_from_start(start, graph, vertices)
+    for start in range(num_vertices):
+        if max_length >= overall_bound:
+            break
+        if bounds[component[start]] <= max_length:
+            continue
+        path_length, depth = greedy_path_from_start(start, indptr, nbrs, weights, visited, path)
         if path_length > max_length:
             max_length = path_length
-            best_path = path
+            best_path = path[:depth]
+        for v in path[:depth]:
+            visited[v] = 0
     
     return max_length, best_path
 
 
+def solve(input_source):
+    """
+    Read a graph and return (max_length, path) for the approximate longest
+    path, with max_length as an int and path as a list of vertex names.
+    Used by the study scripts to run the solver in-process.
+    """
+    names, indptr, nbrs, weights = read_graph(input_source)
+    
+    if not names:
+        return 0, []
+    
+    max_length, best_path = find_longest_path_approx(indptr, nbrs, weights)
+    return int(max_length), [names[v] for v in best_path]
+
+
 def main():
     """Main function."""
     input_source = sys.argv[1] if len(sys.argv) > 1 else sys.stdin
     
-    vertices, graph = read_graph(input_source)
-    
-    if not vertices:
-        print(0)
-        print()
-        return
-    
-    max_length, best_path = find_longest_path_approx(vertices, graph)
+    max_length, path = solve(input_source)
     
-    print(f"{int(max_length)}")
-    print(" ".join(best_path))
+    print(max_length)
+    print(" ".join(path))
 
 
 if __name__ == "__main__":
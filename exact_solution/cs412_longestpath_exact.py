@@ -1,18 +1,24 @@
 #!/usr/bin/env python3
 """
 CS 412 Longest Path - Exact Solution
-This program finds the longest simple path in an undirected graph using brute-force.
+This program finds the longest simple path in an undirected graph.
 
-The longest path problem is NP-complete. This implementation uses a brute-force
-approach that explores all possible paths in the graph.
+The longest path problem is NP-complete. Graphs with up to 20 vertices are
+solved with a Held-Karp style dynamic program over vertex subsets; larger
+graphs fall back to a brute-force approach that explores all possible paths.
 
-Algorithm:
+Algorithm (n <= 20):
+1. For every subset S and endpoint v, compute the longest path that visits
+   exactly S and ends at v, growing S one vertex at a time
+2. Return the best state and trace its path back through the subsets
+
+Algorithm (n > 20):
 1. For each vertex as a starting point, perform DFS to explore all possible paths
 2. Keep track of the longest path found
 3. Return the path with maximum total weight
 
-Time Complexity: O(n! * n) in the worst case, where n is the number of vertices.
-This is because we may need to explore all permutations of vertices.
+Time Complexity: O(2^n * n^2) for the DP; O(n! * n) in the worst case for the
+DFS, because it may need to explore all permutations of vertices.
 
 External Sources and References:
 ---------------------------------
@@ -20,7 +26,21 @@ Cursor IDE was used to develop this code
 """
 
 import sys
-from collections import defaultdict
+from array import array
+from bisect import bisect_left
+
+NEG_INF = float('-inf')
+
+# Graphs with at most this many vertices are solved with the Held-Karp subset
+# DP; larger ones fall back to brute-force DFS
+HELD_KARP_MAX_VERTICES = 20
+
+# DP states pack (vertex subset, endpoint) into one int: subset << 5 | endpoint
+ENDPOINT_BITS = 5
+ENDPOINT_MASK = (1 << ENDPOINT_BITS) - 1
+# Held-Karp keys use HELD_KARP_MAX_VERTICES + ENDPOINT_BITS bits (25), so the
+# finished layers are stored as 32-bit ints, half the size of 'q' arrays
+KEY_TYPECODE = 'i' if HELD_KARP_MAX_VERTICES + ENDPOINT_BITS < 32 else 'q'
 
 
 def read_graph(input_source):
@@ -29,115 +49,321 @@ def read_graph(input_source):
     Format: First line has n (vertices) and m (edges)
     Following m lines have: u v w (edge from u to v with weight w)
     
+    Vertex names are mapped to integer ids 0..n-1 in order of first appearance,
+    and the adjacency is stored in compressed sparse row (CSR) form: the
+    neighbours of vertex v are nbrs[indptr[v]:indptr[v + 1]], and the matching
+    edge weights are weights[indptr[v]:indptr[v + 1]].
+    
     Args:
         input_source: either a file path (string) or file-like object (stdin)
     
     Returns:
-        vertices: set of vertex names
-        graph: dictionary mapping (u, v) -> weight (undirected, so both directions stored)
+        names: list of vertex names, indexed by vertex id
+        indptr, nbrs, weights: CSR adjacency arrays (undirected, so every edge
+            is stored once from each endpoint)
     """
     # Handle both file path and stdin
     if isinstance(input_source, str):
-        f = open(input_source, 'r')
+        f = open(input_source, 'rb')
         should_close = True
     else:
-        f = input_source
+        # Read stdin as raw bytes when possible; text streams are encoded below
+        f = getattr(input_source, 'buffer', input_source)
         should_close = False
     
     try:
-        # Read all lines, filtering out empty lines
-        lines = [line.strip() for line in f if line.strip()]
+        data = f.read()
     finally:
         if should_close:
             f.close()
     
-    if not lines:
-        return set(), {}
+    # Tokenize the whole input in one call instead of splitting it line by
+    # line; only vertex names are ever decoded back to str
+    if isinstance(data, str):
+        data = data.encode()
+    tokens = data.split()
+    
+    if not tokens:
+        return [], array('i', [0]), array('i'), array('d')
     
-    n, m = map(int, lines[0].split())
-    graph = defaultdict(dict)
-    vertices = set()
+    n, m = int(tokens[0]), int(tokens[1])
+    ids = {}
+    edge_index = {}
+    edge_u = []
+    edge_v = []
+    edge_w = []
     
     # Read edges - only read as many as are available (in case file has fewer than m)
-    # Start from index 1 (after header) and read up to min(m, available_lines)
-    num_available_edges = len(lines) - 1  # Subtract 1 for header line
-    num_edges_to_read = min(m, num_available_edges)
-    
-    for i in range(1, num_edges_to_read + 1):
-        if i >= len(lines):
-            break  # Safety check
-        parts = lines[i].split()
-        if len(parts) >= 3:
-            u, v = parts[0], parts[1]
-            w = float(parts[2])
-            vertices.add(u)
-            vertices.add(v)
-            # Store edge in both directions (undirected graph)
-            graph[u][v] = w
-            graph[v][u] = w
-    
-    return vertices, graph
-
-
-def find_longest_path(vertices, graph):
+    # Each edge is three tokens after the two header tokens
+    num_available_edges = (len(tokens) - 2) // 3
+    end = 2 + 3 * min(m, num_available_edges)
+    for a, b, w in zip(tokens[2:end:3], tokens[3:end:3], map(float, tokens[4:end:3])):
+        u = ids.setdefault(a, len(ids))
+        v = ids.setdefault(b, len(ids))
+        if u == v:
+            continue  # A self-loop can never be part of a simple path
+        # A repeated edge keeps its original position but takes the new weight
+        key = (u, v) if u < v else (v, u)
+        k = edge_index.get(key)
+        if k is None:
+            edge_index[key] = len(edge_w)
+            edge_u.append(u)
+            edge_v.append(v)
+            edge_w.append(w)
+        else:
+            edge_w[k] = w
+    
+    names = [name.decode() for name in ids]
+    indptr, nbrs, weights = build_csr(len(names), edge_u, edge_v, edge_w)
+    return names, indptr, nbrs, weights
+
+
+def build_csr(num_vertices, edge_u, edge_v, edge_w):
     """
-    Find the longest simple path in the graph using brute-force DFS.
+    Build CSR adjacency arrays from an undirected edge list.
     
-    This function tries all possible paths starting from each vertex.
-    It uses backtracking to explore all paths without cycles.
+    Each vertex lists its neighbours by descending edge weight (equal weights
+    keep the order the edges were read), so searches try heavy edges first.
+    """
+    indptr = array('i', [0]) * (num_vertices + 1)
+    for u, v in zip(edge_u, edge_v):
+        indptr[u + 1] += 1
+        indptr[v + 1] += 1
+    for v in range(num_vertices):
+        indptr[v + 1] += indptr[v]
+    
+    nbrs = array('i', [0]) * indptr[num_vertices]
+    weights = array('d', [0.0]) * indptr[num_vertices]
+    fill = indptr[:num_vertices]
+    # Filling rows in descending weight order leaves every row sorted; the
+    # sort is stable, so equal weights stay in read order
+    order = sorted(range(len(edge_w)), key=edge_w.__getitem__, reverse=True)
+    for i in order:
+        u, v, w = edge_u[i], edge_v[i], edge_w[i]
+        k = fill[u]
+        nbrs[k] = v
+        weights[k] = w
+        fill[u] = k + 1
+        k = fill[v]
+        nbrs[k] = u
+        weights[k] = w
+        fill[v] = k + 1
+    
+    return indptr, nbrs, weights
+
+
+def find_longest_path(indptr, nbrs, weights):
+    """
+    Find the longest simple path in the graph.
+    
+    Graphs with at most HELD_KARP_MAX_VERTICES vertices are solved with the
+    Held-Karp subset DP; larger graphs fall back to brute-force DFS.
     
     Returns:
         (max_length, best_path): tuple of maximum path length and the path itself
+            as a list of vertex ids
     """
-    if not vertices:
+    num_vertices = len(indptr) - 1
+    if num_vertices == 0:
         return 0, []
     
+    # Slice each CSR row into (neighbor, weight) pairs once, up front, so the
+    # search does not re-read the arrays on every visit
+    rows = [list(zip(nbrs[indptr[v]:indptr[v + 1]], weights[indptr[v]:indptr[v + 1]]))
+            for v in range(num_vertices)]
+    
+    if num_vertices <= HELD_KARP_MAX_VERTICES:
+        return held_karp_longest_path(rows)
+    return brute_force_longest_path(rows)
+
+
+def held_karp_longest_path(rows):
+    """
+    Find the longest simple path by dynamic programming over vertex subsets.
+    
+    best(S, v) is the weight of the longest path that visits exactly the
+    vertex set S and ends at v. The states with |S| = k + 1 are built from
+    those with |S| = k by extending along one edge to a vertex outside S.
+    Only reachable states are stored, so sparse graphs stay far below the
+    O(2^n * n) worst case, and the run time is O(2^n * n^2) instead of O(n!).
+    
+    A state is keyed as (S << ENDPOINT_BITS) | v. Finished layers are kept as
+    sorted arrays (much smaller than the dicts) so the best path can be
+    traced back at the end.
+    """
+    num_vertices = len(rows)
     max_length = 0
-    best_path = []
+    best_key = None
+    best_size = 0
+    finished = []
+    layer = {(1 << v) << ENDPOINT_BITS | v: 0 for v in range(num_vertices)}
+    # Each row pre-shifted into key space as (bit, step, weight): bit is the
+    # neighbour's subset bit within a key, so it is outside S when key & bit
+    # is clear, and step = bit | neighbour turns (key minus its endpoint)
+    # into the extended state. This saves unpacking and repacking S per edge
+    steps = []
+    for row in rows:
+        step_row = []
+        for neighbor, weight in row:
+            bit = 1 << (neighbor + ENDPOINT_BITS)
+            step_row.append((bit, bit | neighbor, weight))
+        steps.append(step_row)
     
-    # Try each vertex as a starting point
-    for start in vertices:
-        visited = set()
-        current_path = []
-        current_length = 0
-        
-        def dfs(current_vertex, path_length, path):
-            """
-            Depth-first search to explore all paths from current_vertex.
-            
-            Args:
-                current_vertex: current vertex in the path
-                path_length: total weight of the current path
-                path: list of vertices in the current path
-            """
-            nonlocal max_length, best_path
-            
-            # Update best path if current path is LONGER (maximizing for longest path)
-            # This is the LONGEST path problem, so we maximize the path length
+    while layer:
+        next_layer = {}
+        get = next_layer.get
+        for key, path_length in layer.items():
             if path_length > max_length:
                 max_length = path_length
-                best_path = path[:]
-            
-            # Try all neighbors
-            if current_vertex in graph:
-                for neighbor, weight in graph[current_vertex].items():
-                    if neighbor not in visited:
-                        # Add neighbor to path
-                        visited.add(neighbor)
-                        path.append(neighbor)
-                        dfs(neighbor, path_length + weight, path)
-                        # Backtrack
-                        path.pop()
-                        visited.remove(neighbor)
+                best_key = key
+                best_size = len(finished)
+            vertex = key & ENDPOINT_MASK
+            base = key ^ vertex
+            for bit, step, weight in steps[vertex]:
+                if not key & bit:
+                    next_key = base | step
+                    next_length = path_length + weight
+                    if next_length > get(next_key, NEG_INF):
+                        next_layer[next_key] = next_length
+        
+        keys = sorted(layer)
+        finished.append((array(KEY_TYPECODE, keys), array('d', [layer[k] for k in keys])))
+        layer = next_layer
+    
+    if best_key is None:
+        return 0, []
+    
+    # Walk back through the layers: the predecessor of (S, v) is a state
+    # (S - {v}, u) whose length plus w(u, v) gives exactly the current length
+    key = best_key
+    path_length = max_length
+    best_path = [key & ENDPOINT_MASK]
+    for size in range(best_size, 0, -1):
+        vertex = key & ENDPOINT_MASK
+        prev_mask = (key >> ENDPOINT_BITS) ^ (1 << vertex)
+        keys, lengths = finished[size - 1]
+        for neighbor, weight in rows[vertex]:
+            if prev_mask >> neighbor & 1:
+                prev_key = prev_mask << ENDPOINT_BITS | neighbor
+                i = bisect_left(keys, prev_key)
+                if i < len(keys) and keys[i] == prev_key and lengths[i] + weight == path_length:
+                    break
+        key = prev_key
+        path_length = lengths[i]
+        best_path.append(neighbor)
+    
+    # Report the path in a fixed direction: lower vertex id first
+    if best_path[0] > best_path[-1]:
+        best_path.reverse()
+    return max_length, best_path
+
+
+def brute_force_longest_path(rows):
+    """
+    Find the longest simple path in the graph using brute-force DFS.
+    
+    This function tries all possible paths starting from each vertex.
+    It uses backtracking (with an explicit stack rather than recursion) to
+    explore all paths without cycles, skipping branches whose upper bound
+    cannot beat the best path found so far.
+    
+    The graph is undirected, so a path and its reverse are the same path.
+    By the time the search starts from vertex s, every path with an endpoint
+    below s has already been tried from that endpoint, so only paths that end
+    above s are still needed. A branch is dropped once it can no longer reach
+    such an endpoint.
+    """
+    num_vertices = len(rows)
+    
+    # Branch and bound: a path can still gain at most the heaviest edge of
+    # every vertex it has not visited yet. remaining holds that sum over the
+    # unvisited vertices; a branch that cannot beat max_length even with all
+    # of it is cut off before it is pushed.
+    max_edge = [max((weight for _, weight in row), default=0) for row in rows]
+    max_edge = [weight if weight > 0 else 0 for weight in max_edge]
+    remaining = sum(max_edge)
+    
+    # The DFS is iterative: level d of the search keeps the vertex path[d],
+    # the path weight up to it in lengths[d], and an iterator over its
+    # remaining neighbors in pending[d]
+    visited = bytearray(num_vertices)
+    path = [0] * num_vertices
+    lengths = [0] * num_vertices
+    max_length = 0
+    best_path = []
+    
+    # Try each vertex as a starting point; later counts the unvisited vertices
+    # with a higher id than start, i.e. the endpoints still worth reaching
+    for start in range(num_vertices):
+        later = num_vertices - 1 - start
+        visited[start] = 1
+        remaining -= max_edge[start]
+        path[0] = start
+        pending = [iter(rows[start])]
+        push = pending.append
+        pop = pending.pop
+        depth = 0
         
-        # Start DFS from this vertex
-        visited.add(start)
-        dfs(start, 0, [start])
-        visited.remove(start)
+        while depth >= 0:
+            # Advance to the next unvisited neighbor of the vertex on top
+            for neighbor, weight in pending[depth]:
+                if not visited[neighbor]:
+                    path_length = lengths[depth] + weight
+                    if path_length + remaining - max_edge[neighbor] <= max_length:
+                        continue
+                    if neighbor < start and not later:
+                        continue
+                    depth += 1
+                    visited[neighbor] = 1
+                    if neighbor > start:
+                        later -= 1
+                    remaining -= max_edge[neighbor]
+                    path[depth] = neighbor
+                    lengths[depth] = path_length
+                    push(iter(rows[neighbor]))
+                    
+                    # Update best path if current path is LONGER (maximizing for longest path)
+                    # This is the LONGEST path problem, so we maximize the path length
+                    if path_length > max_length:
+                        max_length = path_length
+                        best_path = path[:depth + 1]
+                    break
+            else:
+                # No neighbors left: backtrack
+                vertex = path[depth]
+                visited[vertex] = 0
+                if vertex > start:
+                    later += 1
+                remaining += max_edge[vertex]
+                pop()
+                depth -= 1
     
     return max_length, best_path
 
 
+def solve(input_source):
+    """
+    Read a graph and find its longest path.
+    
+    This is the in-process entry point used by the study scripts, so they can
+    time the solver without starting a new interpreter for every test.
+    
+    Args:
+        input_source: either a file path (string) or file-like object
+    
+    Returns:
+        max_length: total weight of the longest path (int)
+        path: list of vertex names along the path
+    """
+    names, indptr, nbrs, weights = read_graph(input_source)
+    
+    if not names:
+        return 0, []
+    
+    max_length, best_path = find_longest_path(indptr, nbrs, weights)
+    return int(max_length), [names[v] for v in best_path]
+
+
 def main():
     """
     Main function to read input, solve longest path, and output result.
@@ -147,18 +373,11 @@ def main():
     else:
         input_file = sys.stdin
     
-    vertices, graph = read_graph(input_file)
-    
-    if not vertices:
-        print(0)
-        print()
-        return
-    
-    max_length, best_path = find_longest_path(vertices, graph)
+    max_length, path = solve(input_file)
     
     # Output: path length on first line, path on second line
-    print(f"{int(max_length)}")
-    print(" ".join(best_path))
+    print(max_length)
+    print(" ".join(path))
 
 
 if __name__ == "__main__":
@@ -10,6 +10,7 @@ References:
 
 import os
 import sys
+from math import lgamma
 
 # Try to import matplotlib, provide helpful error if not available
 try:
@@ -129,12 +130,12 @@ def plot_runtime_analysis(data):
     ax3.set_yscale('log')
     ax3.grid(True, alpha=0.3)
     
-    # Add theoretical O(n!) reference line (scaled)
+    # Add theoretical O(n!) reference line (scaled to pass through the last point)
     if len(vertices) > 2:
         x_theory = np.array(vertices)
-        # Scale factor to roughly match the data
-        scale_factor = runtimes[-1] / (np.math.factorial(vertices[-1]) if vertices[-1] <= 10 else 1e10)
-        y_theory = [scale_factor * np.math.factorial(v) if v <= 10 else scale_factor * 1e10 for v in x_theory]
+        # Work with log(n!) = lgamma(n + 1) so large n neither overflows nor needs clamping
+        log_fact = np.array([lgamma(v + 1) for v in vertices])
+        y_theory = np.exp(log_fact - log_fact[-1]) * runtimes[-1]
         ax3.plot(x_theory, y_theory, 'r--', linewidth=1, alpha=0.5, label='O(n!) reference (scaled)')
         ax3.legend()
     
@@ -25,7 +25,9 @@ OUTPUT:
 
 USAGE:
 ------
-Run this after generating comparison_runs_part_D.txt:
+Run this after generating comparison_runs_part_D.txt (or, with the
+in-process runtime study, comparison_runs_part_D_inprocess.txt, which is
+used instead when it exists):
   python3 part_D/analyze_error_percentage.py
 
 Then review the reports to identify:
@@ -34,22 +36,48 @@ Then review the reports to identify:
 - Overall approximation quality to guide algorithm improvements
 """
 
+import heapq
+import math
 import os
+import pickle
 import sys
+from array import array
 from collections import defaultdict
+from operator import itemgetter, mul
 
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 RUNS_FILE = os.path.join(PROJECT_ROOT, "part_D", "comparison_runs_part_D.txt")
 AVG_DATA_FILE = os.path.join(PROJECT_ROOT, "part_D", "comparison_data_part_D.txt")
+# Prefer the in-process runtime study's files if it has been run
+if os.path.exists(os.path.join(PROJECT_ROOT, "part_D", "comparison_runs_part_D_inprocess.txt")):
+    RUNS_FILE = os.path.join(PROJECT_ROOT, "part_D", "comparison_runs_part_D_inprocess.txt")
+    AVG_DATA_FILE = os.path.join(PROJECT_ROOT, "part_D", "comparison_data_part_D_inprocess.txt")
+SIZES_CACHE_FILE = AVG_DATA_FILE + ".cache.pkl"
 REPORT_FILE = os.path.join(PROJECT_ROOT, "part_D", "error_analysis_report.txt")
 SUMMARY_FILE = os.path.join(PROJECT_ROOT, "part_D", "error_analysis_summary.txt")
 
 
 def read_test_sizes():
-    """Read test case sizes (vertices, edges) from averaged data file."""
+    """
+    Read test case sizes (vertices, edges) from averaged data file.
+    
+    The parsed mapping is pickled next to the data file and reused on later
+    runs for as long as the file's mtime and size are unchanged.
+    """
     sizes = {}
-    if not os.path.exists(AVG_DATA_FILE):
+    try:
+        stat = os.stat(AVG_DATA_FILE)
+    except OSError:
         return sizes
+    cache_key = (stat.st_mtime_ns, stat.st_size)
+    
+    try:
+        with open(SIZES_CACHE_FILE, 'rb') as f:
+            cached_key, cached_sizes = pickle.load(f)
+        if cached_key == cache_key:
+            return cached_sizes
+    except (OSError, EOFError, TypeError, ValueError, pickle.UnpicklingError):
+        pass
     
     with open(AVG_DATA_FILE, 'r') as f:
         for line in f:
@@ -65,9 +93,29 @@ def read_test_sizes():
                     sizes[test_name] = (vertices, edges)
                 except (ValueError, IndexError):
                     continue
+    
+    try:
+        with open(SIZES_CACHE_FILE, 'wb') as f:
+            pickle.dump((cache_key, sizes), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass  # Cache is only an optimization
     return sizes
 
 
+def new_run_columns():
+    """
+    Empty column store for one (test, solver) pair.
+    
+    Runs are kept as parallel columns rather than per-run tuples so the
+    numeric fields sit in contiguous typed arrays.
+    """
+    return {
+        'run_ids': [],
+        'runtimes': array('d'),
+        'path_lengths': array('q')
+    }
+
+
 def read_run_data():
     """Read all individual runs from comparison_runs_part_D.txt."""
     if not os.path.exists(RUNS_FILE):
@@ -75,25 +123,30 @@ def read_run_data():
         print("Please run: python3 part_D/run_part_D_runtime_study.py first")
         sys.exit(1)
     
-    # Structure: test_name -> solver -> list of (run_id, runtime, path_length)
-    runs = defaultdict(lambda: defaultdict(list))
+    # Structure: test_name -> solver -> columns (run_ids, runtimes, path_lengths)
+    runs = defaultdict(lambda: defaultdict(new_run_columns))
     
-    with open(RUNS_FILE, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-            parts = line.split('|')
-            if len(parts) >= 5:
-                try:
-                    test_name = parts[0]
-                    solver = parts[1]  # 'exact' or 'approx'
-                    run_id = parts[2]
-                    runtime = float(parts[3])
-                    path_length = int(parts[4])
-                    runs[test_name][solver].append((run_id, runtime, path_length))
-                except (ValueError, IndexError):
-                    continue
+    # Read the file as raw bytes and split it: this skips the text decoder
+    # and per-line strip, and only the name fields are decoded.
+    with open(RUNS_FILE, 'rb') as f:
+        data = f.read()
+    
+    for line in data.split(b'\n'):
+        parts = line.split(b'|')
+        if len(parts) < 5 or line[:1] == b'#':
+            continue
+        try:
+            runtime = float(parts[3])
+            path_length = int(parts[4])
+            test_name = parts[0].decode()
+            solver = parts[1].decode()  # 'exact' or 'approx'
+            run_id = parts[2].decode()
+        except ValueError:
+            continue
+        columns = runs[test_name][solver]
+        columns['run_ids'].append(run_id)
+        columns['runtimes'].append(runtime)
+        columns['path_lengths'].append(path_length)
     
     return runs
 
@@ -107,37 +160,36 @@ def calculate_error_percentages(runs, test_sizes):
     """
     results = []
     
-    for test_name in sorted(runs.keys()):
-        if 'exact' not in runs[test_name] or 'approx' not in runs[test_name]:
+    for test_name, solver_runs in runs.items():
+        if 'exact' not in solver_runs or 'approx' not in solver_runs:
             continue
         
-        exact_runs = runs[test_name]['exact']
-        approx_runs = runs[test_name]['approx']
+        exact_lengths = solver_runs['exact']['path_lengths']
+        approx_lengths = solver_runs['approx']['path_lengths']
         
         # Get test size
         vertices, edges = test_sizes.get(test_name, (0, 0))
         
-        # Calculate error % for each run pair
-        # We'll match runs by index (run_1 with run_1, etc.)
-        error_percentages = []
-        
-        # Get exact values (should be consistent across runs)
-        exact_values = [pl for _, _, pl in exact_runs]
-        approx_values = [pl for _, _, pl in approx_runs]
-        
         # Use average exact value (should be same, but average for safety)
-        avg_exact = sum(exact_values) / len(exact_values) if exact_values else 0
+        avg_exact = sum(exact_lengths) / len(exact_lengths)
         
         if avg_exact == 0:
             continue  # Skip if no valid exact solution
         
-        # Calculate error % for each approx run
-        for approx_val in approx_values:
-            error_pct = (approx_val / avg_exact) * 100.0
-            error_percentages.append(error_pct)
-        
-        if not error_percentages:
-            continue
+        # Error % for every approx run; sum, min and max are tracked in the
+        # same sweep instead of three more passes over the list.
+        error_percentages = []
+        append = error_percentages.append
+        total = 0.0
+        min_error = max_error = (approx_lengths[0] / avg_exact) * 100.0
+        for pl in approx_lengths:
+            error_pct = (pl / avg_exact) * 100.0
+            append(error_pct)
+            total += error_pct
+            if error_pct < min_error:
+                min_error = error_pct
+            elif error_pct > max_error:
+                max_error = error_pct
         
         results.append({
             'test_name': test_name,
@@ -145,42 +197,37 @@ def calculate_error_percentages(runs, test_sizes):
             'edges': edges,
             'exact_value': int(avg_exact),
             'error_percentages': error_percentages,
-            'avg_error': sum(error_percentages) / len(error_percentages),
-            'min_error': min(error_percentages),
-            'max_error': max(error_percentages),
+            'avg_error': total / len(error_percentages),
+            'min_error': min_error,
+            'max_error': max_error,
             'num_runs': len(error_percentages)
         })
     
     return results
 
 
-def group_by_size(results):
-    """Group results by test size (vertices, edges)."""
-    by_size = defaultdict(list)
+def calculate_size_statistics(results):
+    """
+    Calculate average error % for each test size (vertices, edges).
     
+    Results are grouped and their error percentages pooled in a single pass.
+    """
+    # (vertices, edges) -> [num_tests, pooled error percentages]
+    by_size = defaultdict(lambda: [0, []])
     for result in results:
-        key = (result['vertices'], result['edges'])
-        by_size[key].append(result)
+        group = by_size[(result['vertices'], result['edges'])]
+        group[0] += 1
+        group[1].extend(result['error_percentages'])
     
-    return by_size
-
-
-def calculate_size_statistics(by_size):
-    """Calculate average error % for each test size."""
     size_stats = []
-    
-    for (vertices, edges), test_results in sorted(by_size.items()):
-        all_errors = []
-        for result in test_results:
-            all_errors.extend(result['error_percentages'])
-        
+    for (vertices, edges), (num_tests, all_errors) in sorted(by_size.items()):
         if not all_errors:
             continue
         
         size_stats.append({
             'vertices': vertices,
             'edges': edges,
-            'num_tests': len(test_results),
+            'num_tests': num_tests,
             'num_runs': len(all_errors),
             'avg_error': sum(all_errors) / len(all_errors),
             'min_error': min(all_errors),
@@ -192,12 +239,24 @@ def calculate_size_statistics(by_size):
 
 
 def calculate_std_dev(values):
-    """Calculate standard deviation."""
-    if len(values) <= 1:
+    """Calculate (sample) standard deviation."""
+    n = len(values)
+    if n <= 1:
         return 0.0
-    mean = sum(values) / len(values)
-    variance = sum((x - mean) ** 2 for x in values) / (len(values) - 1)
-    return variance ** 0.5
+    # Sum and sum of squares are both reduced in C; fsum keeps them exact
+    # enough that the subtraction below does not lose precision.
+    total = math.fsum(values)
+    variance = (math.fsum(map(mul, values, values)) - total * total / n) / (n - 1)
+    return math.sqrt(max(variance, 0.0))
+
+
+def count_optimal_runs(all_errors):
+    """Count runs whose error percentage is within 0.01 of 100%."""
+    # Common case: every run is optimal. The extremes bound all other values,
+    # so checking min and max (both C-level scans) settles it.
+    if all_errors and abs(min(all_errors) - 100.0) < 0.01 and abs(max(all_errors) - 100.0) < 0.01:
+        return len(all_errors)
+    return sum(1 for e in all_errors if abs(e - 100.0) < 0.01)
 
 
 def generate_report(results, size_stats):
@@ -210,91 +269,95 @@ def generate_report(results, size_stats):
     overall_min = min(all_errors) if all_errors else 0
     overall_max = max(all_errors) if all_errors else 0
     
+    # Build the whole report in memory and write it out in one call
+    parts = []
+    parts.append("=" * 80 + "\n")
+    parts.append("APPROXIMATION ERROR PERCENTAGE ANALYSIS\n")
+    parts.append("=" * 80 + "\n\n")
+    
+    parts.append("METRIC EXPLANATION:\n")
+    parts.append("-" * 80 + "\n")
+    parts.append("Error Percentage = (Approximate Value / Exact Value) * 100\n\n")
+    parts.append("Interpretation:\n")
+    parts.append("  - 100.00% = Perfect (approximation found optimal solution)\n")
+    parts.append("  - 95.00%  = Approximation is 5% worse than optimal\n")
+    parts.append("  - 90.00%  = Approximation is 10% worse than optimal\n")
+    parts.append("  - < 90%   = Poor performance (needs algorithm improvement)\n\n")
+    parts.append("This metric helps identify:\n")
+    parts.append("  1. Which test sizes are most challenging\n")
+    parts.append("  2. Overall approximation quality\n")
+    parts.append("  3. Areas where the algorithm needs improvement\n\n")
+    
+    parts.append("=" * 80 + "\n")
+    parts.append("OVERALL STATISTICS\n")
+    parts.append("=" * 80 + "\n\n")
+    parts.append(f"Total test cases analyzed: {len(results)}\n")
+    parts.append(f"Total individual runs: {len(all_errors)}\n")
+    parts.append(f"\nOverall Error Percentage:\n")
+    parts.append(f"  Average: {overall_avg:.2f}%\n")
+    parts.append(f"  Minimum: {overall_min:.2f}%\n")
+    parts.append(f"  Maximum: {overall_max:.2f}%\n")
+    if len(all_errors) > 1:
+        std_dev = calculate_std_dev(all_errors)
+        parts.append(f"  Standard Deviation: {std_dev:.2f}%\n")
+    parts.append(f"\n")
+    
+    # Count optimal vs suboptimal
+    optimal_count = count_optimal_runs(all_errors)
+    suboptimal_count = len(all_errors) - optimal_count
+    parts.append(f"Runs finding optimal solution: {optimal_count} ({optimal_count/len(all_errors)*100:.1f}%)\n")
+    parts.append(f"Runs finding suboptimal solution: {suboptimal_count} ({suboptimal_count/len(all_errors)*100:.1f}%)\n\n")
+    
+    parts.append("=" * 80 + "\n")
+    parts.append("STATISTICS BY TEST SIZE\n")
+    parts.append("=" * 80 + "\n\n")
+    parts.append(f"{'Vertices':<10} {'Edges':<10} {'Tests':<8} {'Runs':<8} "
+                 f"{'Avg Error %':<12} {'Min %':<10} {'Max %':<10} {'Std Dev':<10}\n")
+    parts.append("-" * 80 + "\n")
+    
+    parts.extend(f"{stat['vertices']:<10} {stat['edges']:<10} {stat['num_tests']:<8} "
+                 f"{stat['num_runs']:<8} {stat['avg_error']:<12.2f} "
+                 f"{stat['min_error']:<10.2f} {stat['max_error']:<10.2f} "
+                 f"{stat['std_dev']:<10.2f}\n"
+                 for stat in size_stats)
+    
+    parts.append("\n" + "=" * 80 + "\n")
+    parts.append("DETAILED RESULTS BY TEST CASE\n")
+    parts.append("=" * 80 + "\n\n")
+    parts.append(f"{'Test Name':<25} {'Vertices':<10} {'Edges':<10} {'Exact':<8} "
+                 f"{'Avg Error %':<12} {'Min %':<10} {'Max %':<10} {'Runs':<6}\n")
+    parts.append("-" * 80 + "\n")
+    
+    parts.extend(f"{result['test_name']:<25} {result['vertices']:<10} {result['edges']:<10} "
+                 f"{result['exact_value']:<8} {result['avg_error']:<12.2f} "
+                 f"{result['min_error']:<10.2f} {result['max_error']:<10.2f} "
+                 f"{result['num_runs']:<6}\n"
+                 for result in sorted(results, key=lambda x: (x['vertices'], x['edges'], x['test_name'])))
+    
+    parts.append("\n" + "=" * 80 + "\n")
+    parts.append("RECOMMENDATIONS FOR ALGORITHM IMPROVEMENT\n")
+    parts.append("=" * 80 + "\n\n")
+    
+    # Find worst performing test sizes
+    worst_sizes = heapq.nsmallest(3, size_stats, key=itemgetter('avg_error'))
+    parts.append("Test sizes with worst approximation performance:\n")
+    for stat in worst_sizes:
+        parts.append(f"  - {stat['vertices']} vertices, {stat['edges']} edges: "
+                     f"avg {stat['avg_error']:.2f}% (target: improve to >95%)\n")
+    
+    parts.append("\nTest cases with worst individual performance:\n")
+    worst_tests = heapq.nsmallest(5, results, key=itemgetter('avg_error', 'test_name'))
+    for result in worst_tests:
+        if result['avg_error'] < 100.0:
+            parts.append(f"  - {result['test_name']} ({result['vertices']}v, {result['edges']}e): "
+                         f"avg {result['avg_error']:.2f}% (exact={result['exact_value']})\n")
+    
+    parts.append("\n" + "=" * 80 + "\n")
+    parts.append("END OF REPORT\n")
+    parts.append("=" * 80 + "\n")
+    
     with open(REPORT_FILE, 'w') as f:
-        f.write("=" * 80 + "\n")
-        f.write("APPROXIMATION ERROR PERCENTAGE ANALYSIS\n")
-        f.write("=" * 80 + "\n\n")
-        
-        f.write("METRIC EXPLANATION:\n")
-        f.write("-" * 80 + "\n")
-        f.write("Error Percentage = (Approximate Value / Exact Value) * 100\n\n")
-        f.write("Interpretation:\n")
-        f.write("  - 100.00% = Perfect (approximation found optimal solution)\n")
-        f.write("  - 95.00%  = Approximation is 5% worse than optimal\n")
-        f.write("  - 90.00%  = Approximation is 10% worse than optimal\n")
-        f.write("  - < 90%   = Poor performance (needs algorithm improvement)\n\n")
-        f.write("This metric helps identify:\n")
-        f.write("  1. Which test sizes are most challenging\n")
-        f.write("  2. Overall approximation quality\n")
-        f.write("  3. Areas where the algorithm needs improvement\n\n")
-        
-        f.write("=" * 80 + "\n")
-        f.write("OVERALL STATISTICS\n")
-        f.write("=" * 80 + "\n\n")
-        f.write(f"Total test cases analyzed: {len(results)}\n")
-        f.write(f"Total individual runs: {len(all_errors)}\n")
-        f.write(f"\nOverall Error Percentage:\n")
-        f.write(f"  Average: {overall_avg:.2f}%\n")
-        f.write(f"  Minimum: {overall_min:.2f}%\n")
-        f.write(f"  Maximum: {overall_max:.2f}%\n")
-        if len(all_errors) > 1:
-            std_dev = calculate_std_dev(all_errors)
-            f.write(f"  Standard Deviation: {std_dev:.2f}%\n")
-        f.write(f"\n")
-        
-        # Count optimal vs suboptimal
-        optimal_count = sum(1 for e in all_errors if abs(e - 100.0) < 0.01)
-        suboptimal_count = len(all_errors) - optimal_count
-        f.write(f"Runs finding optimal solution: {optimal_count} ({optimal_count/len(all_errors)*100:.1f}%)\n")
-        f.write(f"Runs finding suboptimal solution: {suboptimal_count} ({suboptimal_count/len(all_errors)*100:.1f}%)\n\n")
-        
-        f.write("=" * 80 + "\n")
-        f.write("STATISTICS BY TEST SIZE\n")
-        f.write("=" * 80 + "\n\n")
-        f.write(f"{'Vertices':<10} {'Edges':<10} {'Tests':<8} {'Runs':<8} "
-                f"{'Avg Error %':<12} {'Min %':<10} {'Max %':<10} {'Std Dev':<10}\n")
-        f.write("-" * 80 + "\n")
-        
-        for stat in size_stats:
-            f.write(f"{stat['vertices']:<10} {stat['edges']:<10} {stat['num_tests']:<8} "
-                    f"{stat['num_runs']:<8} {stat['avg_error']:<12.2f} "
-                    f"{stat['min_error']:<10.2f} {stat['max_error']:<10.2f} "
-                    f"{stat['std_dev']:<10.2f}\n")
-        
-        f.write("\n" + "=" * 80 + "\n")
-        f.write("DETAILED RESULTS BY TEST CASE\n")
-        f.write("=" * 80 + "\n\n")
-        f.write(f"{'Test Name':<25} {'Vertices':<10} {'Edges':<10} {'Exact':<8} "
-                f"{'Avg Error %':<12} {'Min %':<10} {'Max %':<10} {'Runs':<6}\n")
-        f.write("-" * 80 + "\n")
-        
-        for result in sorted(results, key=lambda x: (x['vertices'], x['edges'], x['test_name'])):
-            f.write(f"{result['test_name']:<25} {result['vertices']:<10} {result['edges']:<10} "
-                    f"{result['exact_value']:<8} {result['avg_error']:<12.2f} "
-                    f"{result['min_error']:<10.2f} {result['max_error']:<10.2f} "
-                    f"{result['num_runs']:<6}\n")
-        
-        f.write("\n" + "=" * 80 + "\n")
-        f.write("RECOMMENDATIONS FOR ALGORITHM IMPROVEMENT\n")
-        f.write("=" * 80 + "\n\n")
-        
-        # Find worst performing test sizes
-        worst_sizes = sorted(size_stats, key=lambda x: x['avg_error'])[:3]
-        f.write("Test sizes with worst approximation performance:\n")
-        for stat in worst_sizes:
-            f.write(f"  - {stat['vertices']} vertices, {stat['edges']} edges: "
-                    f"avg {stat['avg_error']:.2f}% (target: improve to >95%)\n")
-        
-        f.write("\nTest cases with worst individual performance:\n")
-        worst_tests = sorted(results, key=lambda x: x['avg_error'])[:5]
-        for result in worst_tests:
-            if result['avg_error'] < 100.0:
-                f.write(f"  - {result['test_name']} ({result['vertices']}v, {result['edges']}e): "
-                        f"avg {result['avg_error']:.2f}% (exact={result['exact_value']})\n")
-        
-        f.write("\n" + "=" * 80 + "\n")
-        f.write("END OF REPORT\n")
-        f.write("=" * 80 + "\n")
+        f.write(''.join(parts))
     
     print(f"Detailed report written to: {REPORT_FILE}")
 
@@ -306,20 +369,24 @@ def generate_summary(results, size_stats):
         all_errors.extend(result['error_percentages'])
     
     overall_avg = sum(all_errors) / len(all_errors) if all_errors else 0
-    optimal_count = sum(1 for e in all_errors if abs(e - 100.0) < 0.01)
+    optimal_count = count_optimal_runs(all_errors)
+    
+    # Build the summary in memory and write it out in one call, as the report
+    parts = []
+    parts.append("APPROXIMATION ERROR PERCENTAGE - QUICK SUMMARY\n")
+    parts.append("=" * 60 + "\n\n")
+    parts.append(f"Overall Average Error: {overall_avg:.2f}%\n")
+    parts.append(f"Optimal Solutions Found: {optimal_count}/{len(all_errors)} "
+                 f"({optimal_count/len(all_errors)*100:.1f}%)\n\n")
+    parts.append("By Test Size:\n")
+    parts.append("-" * 60 + "\n")
+    parts.append(f"{'Vertices':<10} {'Edges':<10} {'Avg Error %':<15}\n")
+    parts.append("-" * 60 + "\n")
+    parts.extend(f"{stat['vertices']:<10} {stat['edges']:<10} {stat['avg_error']:<15.2f}\n"
+                 for stat in sorted(size_stats, key=itemgetter('vertices', 'edges')))
     
     with open(SUMMARY_FILE, 'w') as f:
-        f.write("APPROXIMATION ERROR PERCENTAGE - QUICK SUMMARY\n")
-        f.write("=" * 60 + "\n\n")
-        f.write(f"Overall Average Error: {overall_avg:.2f}%\n")
-        f.write(f"Optimal Solutions Found: {optimal_count}/{len(all_errors)} "
-                f"({optimal_count/len(all_errors)*100:.1f}%)\n\n")
-        f.write("By Test Size:\n")
-        f.write("-" * 60 + "\n")
-        f.write(f"{'Vertices':<10} {'Edges':<10} {'Avg Error %':<15}\n")
-        f.write("-" * 60 + "\n")
-        for stat in sorted(size_stats, key=lambda x: (x['vertices'], x['edges'])):
-            f.write(f"{stat['vertices']:<10} {stat['edges']:<10} {stat['avg_error']:<15.2f}\n")
+        f.write(''.join(parts))
     
     print(f"Summary written to: {SUMMARY_FILE}")
 
@@ -338,11 +405,8 @@ def main():
         print("Error: No valid results found!")
         return
     
-    print("Grouping by test size...")
-    by_size = group_by_size(results)
-    
     print("Calculating statistics by size...")
-    size_stats = calculate_size_statistics(by_size)
+    size_stats = calculate_size_statistics(results)
     
     print("Generating reports...")
     generate_report(results, size_stats)
@@ -7,6 +7,8 @@ These will be added to the existing test suite.
 import random
 import os
 
+from graph_sampling import sample_weighted_edges
+
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 OUTPUT_DIR = os.path.join(PROJECT_ROOT, "part_D", "additional_test_cases")
 os.makedirs(OUTPUT_DIR, exist_ok=True)
@@ -14,8 +16,9 @@ os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 def generate_graph(n, m, weight_range=(1, 100), seed=None):
     """Generate a graph with n vertices and m edges."""
-    if seed is not None:
-        random.seed(seed)
+    # A private generator keeps each graph reproducible from its seed alone,
+    # without touching (or depending on) the global random state
+    rng = random.Random(seed)
     
     # Ensure m doesn't exceed maximum possible edges
     max_edges = n * (n - 1) // 2
@@ -23,12 +26,8 @@ def generate_graph(n, m, weight_range=(1, 100), seed=None):
         m = max_edges
     
     vertices = [f"v{i}" for i in range(1, n + 1)]
-    possible_edges = [(vertices[i], vertices[j]) 
-                      for i in range(n) for j in range(i + 1, n)]
     
-    selected_edges = random.sample(possible_edges, m)
-    edges = [(u, v, random.randint(weight_range[0], weight_range[1])) 
-             for u, v in selected_edges]
+    edges = sample_weighted_edges(rng, n, m, vertices, weight_range)
     
     return vertices, edges
 
@@ -38,10 +37,12 @@ def write_test_case(filename, vertices, edges):
     n = len(vertices)
     m = len(edges)
     
+    # Build the whole file first and write it in one call rather than one
+    # write per edge
+    lines = [f"{n} {m}"]
+    lines.extend([f"{u} {v} {w}" for u, v, w in edges])
     with open(filename, 'w') as f:
-        f.write(f"{n} {m}\n")
-        for u, v, w in edges:
-            f.write(f"{u} {v} {w}\n")
+        f.write("\n".join(lines) + "\n")
 
 
 def main():
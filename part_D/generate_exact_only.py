@@ -3,92 +3,36 @@
 Generate line graph for Exact solution only using Part D additional test cases.
 """
 
+import argparse
 import os
-import subprocess
-import time
 import sys
 import csv
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
-try:
-    import matplotlib.pyplot as plt
-    import numpy as np
-except ImportError:
-    print("Error: matplotlib is not installed.")
-    print("Install with: pip install matplotlib numpy")
-    sys.exit(1)
+from graph_size import read_graph_size
+from plot_utils import import_pyplot, save_png_and_pdf, uniform_test_names
+from project_paths import EXACT_SCRIPT, SCRIPT_DIR, TEST_DIR
+from solver_runner import run_solver
 
-PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
-PROJECT_ROOT = os.path.dirname(PROJECT_ROOT)
-
-EXACT_SCRIPT = os.path.join(PROJECT_ROOT, "exact_solution", "cs412_longestpath_exact.py")
-
-TEST_DIR = os.path.join(PROJECT_ROOT, "part_D", "additional_test_cases")
-CSV_FILE = os.path.join(PROJECT_ROOT, "part_D", "exact_only_comparison.csv")
-PNG_FILE = os.path.join(PROJECT_ROOT, "part_D", "exact_only_comparison.png")
-PDF_FILE = os.path.join(PROJECT_ROOT, "part_D", "exact_only_comparison.pdf")
+CSV_FILE = os.path.join(SCRIPT_DIR, "exact_only_comparison.csv")
+PNG_FILE = os.path.join(SCRIPT_DIR, "exact_only_comparison.png")
+PDF_FILE = os.path.join(SCRIPT_DIR, "exact_only_comparison.pdf")
 
 # Timeout
 EXACT_TIMEOUT = 60.0
 
 
-def read_graph_size(path):
-    """Read first line and return (n_vertices, n_edges)."""
-    try:
-        with open(path, "r") as f:
-            first = f.readline().strip()
-        if not first:
-            return 0, 0
-        parts = first.split()
-        if len(parts) < 2:
-            return 0, 0
-        n = int(parts[0])
-        m = int(parts[1])
-        return n, m
-    except:
-        return 0, 0
-
-
-def run_solver(script, input_path, timeout):
-    """Run solver and return (success, runtime, path_length)."""
-    start = time.time()
-    try:
-        with open(input_path, "r") as f:
-            proc = subprocess.run(
-                ["python3", script],
-                stdin=f,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-            )
-        elapsed = time.time() - start
-    except subprocess.TimeoutExpired:
-        return False, timeout, 0
-    except Exception:
-        return False, 0.0, 0
-
-    if proc.returncode != 0:
-        return False, elapsed, 0
-
-    lines = proc.stdout.strip().splitlines()
-    if not lines:
-        return False, elapsed, 0
-
-    try:
-        length = int(lines[0].strip().split()[0])
-    except ValueError:
-        length = 0
-
-    return True, elapsed, length
-
-
-def generate_data():
-    """Generate data and save to CSV."""
+def generate_data(workers=1):
+    """Generate data and save to CSV, keeping workers solves running at once."""
     if not os.path.isdir(TEST_DIR):
         print(f"Error: Test directory not found: {TEST_DIR}")
         sys.exit(1)
 
-    # Get all .txt files, sorted
-    test_files = sorted([f for f in os.listdir(TEST_DIR) if f.endswith(".txt")])
+    # Get all .txt files as (name, path), sorted; scandir hands back the
+    # joined path with each entry
+    with os.scandir(TEST_DIR) as entries:
+        test_files = sorted((e.name, e.path) for e in entries if e.name.endswith(".txt") and e.is_file())
     
     if not test_files:
         print(f"Error: No test files found in {TEST_DIR}")
@@ -100,37 +44,45 @@ def generate_data():
 
     data = []
 
-    for test_file in test_files:
-        test_path = os.path.join(TEST_DIR, test_file)
+    jobs = []
+    for test_file, test_path in test_files:
         n, m = read_graph_size(test_path)
         
         if n == 0 and m == 0:
             continue
+        jobs.append((test_file, test_path, n, m))
+
+    # Solves run in-process in `workers` worker processes (each loads the
+    # solver once); map() yields results in test order. Rows are written to
+    # the CSV as each solve finishes, so a crash part way through still
+    # leaves the completed results on disk
+    test_paths = [job[1] for job in jobs]
+    with open(CSV_FILE, "w", newline="") as csvfile, \
+            ProcessPoolExecutor(max_workers=workers) as executor:
+        fieldnames = ["test_name", "vertices", "edges", "exact_time", "exact_value"]
+        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        writer.writeheader()
 
-        print(f"Running {test_file}: {n} vertices, {m} edges", end=" ... ", flush=True)
+        for (test_file, test_path, n, m), (exact_ok, exact_time, exact_len) in zip(
+                jobs, executor.map(run_solver, repeat(EXACT_SCRIPT), test_paths,
+                                   repeat(EXACT_TIMEOUT))):
+            print(f"Running {test_file}: {n} vertices, {m} edges", end=" ... ", flush=True)
 
-        # Run Exact
-        exact_ok, exact_time, exact_len = run_solver(EXACT_SCRIPT, test_path, EXACT_TIMEOUT)
-        if not exact_ok or exact_time >= EXACT_TIMEOUT * 0.9:
-            print("TIMEOUT")
-            continue
+            if not exact_ok or exact_time >= EXACT_TIMEOUT * 0.9:
+                print("TIMEOUT")
+                continue
 
-        data.append({
-            "test_name": test_file,
-            "vertices": n,
-            "edges": m,
-            "exact_time": exact_time,
-            "exact_value": exact_len,
-        })
+            row = {
+                "test_name": test_file,
+                "vertices": n,
+                "edges": m,
+                "exact_time": exact_time,
+                "exact_value": exact_len,
+            }
+            data.append(row)
+            writer.writerow(row)
 
-        print(f"✓ ({exact_time:.3f}s, length={exact_len})")
-
-    # Save to CSV
-    with open(CSV_FILE, "w", newline="") as csvfile:
-        fieldnames = ["test_name", "vertices", "edges", "exact_time", "exact_value"]
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(data)
+            print(f"✓ ({exact_time:.3f}s, length={exact_len})")
 
     print()
     print(f"Data saved to: {CSV_FILE}")
@@ -143,25 +95,14 @@ def plot_exact_only(data):
         print("No data to plot.")
         return
 
+    plt = import_pyplot()
+
     # Sort by complexity: edges first, then vertices
     data.sort(key=lambda d: (d["edges"], d["vertices"]))
 
     # Create uniform test names
-    size_counts = {}
-    uniform_names = []
-    for d in data:
-        v = d["vertices"]
-        e = d["edges"]
-        key = (v, e)
-        if key not in size_counts:
-            size_counts[key] = 0
-        size_counts[key] += 1
-        count = size_counts[key]
-
-        if count == 1:
-            uniform_names.append(f"{v}v_{e}")
-        else:
-            uniform_names.append(f"{v}v_{e}_{count}")
+    uniform_names = uniform_test_names((d["vertices"] for d in data),
+                                       (d["edges"] for d in data))
 
     exact_times = [d["exact_time"] for d in data]
 
@@ -182,29 +123,39 @@ def plot_exact_only(data):
     ax.legend(loc="upper left", fontsize=11, framealpha=0.9)
 
     plt.tight_layout()
-    plt.savefig(PNG_FILE, dpi=300, bbox_inches="tight")
-    plt.savefig(PDF_FILE, bbox_inches="tight")
+    save_png_and_pdf(fig, PNG_FILE, PDF_FILE)
     print(f"Graph saved to:\n  {PNG_FILE}\n  {PDF_FILE}")
     plt.close()
 
 
 def main():
+    parser = argparse.ArgumentParser(
+        description="Run the exact solver on the Part D additional test cases and plot its runtime.")
+    parser.add_argument("--no-plot", action="store_true",
+                        help="only regenerate the CSV; skip the graph (and the matplotlib import)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="solver runs to keep going at once (default: 1); more than "
+                             "one makes runs share the CPU, which skews their timings")
+    args = parser.parse_args()
+
     print("=" * 80)
     print("Exact Solution Only - Part D Additional Test Cases")
     print("=" * 80)
     print()
 
-    data = generate_data()
+    data = generate_data(args.workers)
 
     if data:
-        print()
-        print("Generating line graph...")
-        plot_exact_only(data)
+        if not args.no_plot:
+            print()
+            print("Generating line graph...")
+            plot_exact_only(data)
         print()
         print("=" * 80)
         print("Complete!")
         print(f"CSV file: {CSV_FILE}")
-        print(f"Graph files: {PNG_FILE}, {PDF_FILE}")
+        if not args.no_plot:
+            print(f"Graph files: {PNG_FILE}, {PDF_FILE}")
         print("=" * 80)
     else:
         print("No data generated.")
@@ -4,66 +4,44 @@ Generate comparison data for Exact vs Greedy solutions using Part D additional t
 Creates both a CSV file and a line graph.
 """
 
+import argparse
 import os
 import subprocess
 import time
 import sys
 import csv
 
-try:
-    import matplotlib.pyplot as plt
-    import numpy as np
-except ImportError:
-    print("Error: matplotlib is not installed.")
-    print("Install with: pip install matplotlib numpy")
-    sys.exit(1)
+from graph_size import read_graph_size
+from plot_utils import import_pyplot, save_png_and_pdf, uniform_test_names
+from project_paths import APPROX_SCRIPT as GREEDY_SCRIPT
+from project_paths import EXACT_SCRIPT, SCRIPT_DIR, TEST_DIR
 
-PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
-PROJECT_ROOT = os.path.dirname(PROJECT_ROOT)
-
-EXACT_SCRIPT = os.path.join(PROJECT_ROOT, "exact_solution", "cs412_longestpath_exact.py")
-GREEDY_SCRIPT = os.path.join(PROJECT_ROOT, "approx_solution", "cs412_longestpath_approx.py")
-
-TEST_DIR = os.path.join(PROJECT_ROOT, "part_D", "additional_test_cases")
-CSV_FILE = os.path.join(PROJECT_ROOT, "part_D", "exact_vs_greedy_comparison.csv")
-PNG_FILE = os.path.join(PROJECT_ROOT, "part_D", "exact_vs_greedy_comparison.png")
-PDF_FILE = os.path.join(PROJECT_ROOT, "part_D", "exact_vs_greedy_comparison.pdf")
+CSV_FILE = os.path.join(SCRIPT_DIR, "exact_vs_greedy_comparison.csv")
+PNG_FILE = os.path.join(SCRIPT_DIR, "exact_vs_greedy_comparison.png")
+PDF_FILE = os.path.join(SCRIPT_DIR, "exact_vs_greedy_comparison.pdf")
 
 # Timeouts
 EXACT_TIMEOUT = 60.0
 GREEDY_TIMEOUT = 10.0
 
 
-def read_graph_size(path):
-    """Read first line and return (n_vertices, n_edges)."""
-    try:
-        with open(path, "r") as f:
-            first = f.readline().strip()
-        if not first:
-            return 0, 0
-        parts = first.split()
-        if len(parts) < 2:
-            return 0, 0
-        n = int(parts[0])
-        m = int(parts[1])
-        return n, m
-    except:
-        return 0, 0
-
-
 def run_solver(script, input_path, timeout):
     """Run solver and return (success, runtime, path_length)."""
-    start = time.time()
+    # Monotonic nanosecond clock (unaffected by wall-clock adjustments)
+    start = time.perf_counter_ns()
     try:
         with open(input_path, "r") as f:
+            # stderr is never read, so it goes to /dev/null rather than
+            # being buffered in memory alongside stdout
             proc = subprocess.run(
                 ["python3", script],
                 stdin=f,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True,
                 timeout=timeout,
             )
-        elapsed = time.time() - start
+        elapsed = (time.perf_counter_ns() - start) / 1e9
     except subprocess.TimeoutExpired:
         return False, timeout, 0
     except Exception:
@@ -72,12 +50,14 @@ def run_solver(script, input_path, timeout):
     if proc.returncode != 0:
         return False, elapsed, 0
 
-    lines = proc.stdout.strip().splitlines()
-    if not lines:
+    # Only the first line (the path length) is needed; partition it off
+    # instead of splitting the whole output, which includes the path
+    fields = proc.stdout.lstrip().partition("\n")[0].split()
+    if not fields:
         return False, elapsed, 0
 
     try:
-        length = int(lines[0].strip().split()[0])
+        length = int(fields[0])
     except ValueError:
         length = 0
 
@@ -90,8 +70,11 @@ def generate_data():
         print(f"Error: Test directory not found: {TEST_DIR}")
         sys.exit(1)
 
-    # Get all .txt files, sorted
-    test_files = sorted([f for f in os.listdir(TEST_DIR) if f.endswith(".txt")])
+    # Get all .txt files as (name, path), sorted, from one scandir pass
+    # (entry types come with the listing, so is_file() needs no extra stat,
+    # and each entry carries its joined path)
+    with os.scandir(TEST_DIR) as entries:
+        test_files = sorted((e.name, e.path) for e in entries if e.name.endswith(".txt") and e.is_file())
     
     if not test_files:
         print(f"Error: No test files found in {TEST_DIR}")
@@ -103,8 +86,7 @@ def generate_data():
 
     data = []
 
-    for test_file in test_files:
-        test_path = os.path.join(TEST_DIR, test_file)
+    for test_file, test_path in test_files:
         n, m = read_graph_size(test_path)
         
         if n == 0 and m == 0:
@@ -159,25 +141,14 @@ def plot_comparison(data):
         print("No data to plot.")
         return
 
+    plt = import_pyplot()
+
     # Sort by complexity: edges first, then vertices
     data.sort(key=lambda d: (d["edges"], d["vertices"]))
 
     # Create uniform test names
-    size_counts = {}
-    uniform_names = []
-    for d in data:
-        v = d["vertices"]
-        e = d["edges"]
-        key = (v, e)
-        if key not in size_counts:
-            size_counts[key] = 0
-        size_counts[key] += 1
-        count = size_counts[key]
-
-        if count == 1:
-            uniform_names.append(f"{v}v_{e}")
-        else:
-            uniform_names.append(f"{v}v_{e}_{count}")
+    uniform_names = uniform_test_names((d["vertices"] for d in data),
+                                       (d["edges"] for d in data))
 
     exact_times = [d["exact_time"] for d in data]
     greedy_times = [d["greedy_time"] for d in data]
@@ -200,13 +171,18 @@ def plot_comparison(data):
     ax.legend(loc="upper left", fontsize=11, framealpha=0.9)
 
     plt.tight_layout()
-    plt.savefig(PNG_FILE, dpi=300, bbox_inches="tight")
-    plt.savefig(PDF_FILE, bbox_inches="tight")
+    save_png_and_pdf(fig, PNG_FILE, PDF_FILE)
     print(f"Graph saved to:\n  {PNG_FILE}\n  {PDF_FILE}")
     plt.close()
 
 
 def main():
+    parser = argparse.ArgumentParser(
+        description="Run the exact and greedy solvers on the Part D additional test cases and plot their runtimes.")
+    parser.add_argument("--no-plot", action="store_true",
+                        help="only regenerate the CSV; skip the graph (and the matplotlib import)")
+    args = parser.parse_args()
+
     print("=" * 80)
     print("Exact vs Greedy Comparison - Part D Additional Test Cases")
     print("=" * 80)
@@ -215,14 +191,16 @@ def main():
     data = generate_data()
 
     if data:
-        print()
-        print("Generating line graph...")
-        plot_comparison(data)
+        if not args.no_plot:
+            print()
+            print("Generating line graph...")
+            plot_comparison(data)
         print()
         print("=" * 80)
         print("Complete!")
         print(f"CSV file: {CSV_FILE}")
-        print(f"Graph files: {PNG_FILE}, {PDF_FILE}")
+        if not args.no_plot:
+            print(f"Graph files: {PNG_FILE}, {PDF_FILE}")
         print("=" * 80)
     else:
         print("No data generated.")
@@ -7,103 +7,106 @@ Green bars for 100% (optimal), orange to red for suboptimal.
 import os
 import sys
 import csv
+from operator import itemgetter
 
-try:
-    import matplotlib.pyplot as plt
-    import numpy as np
-except ImportError:
-    print("Error: matplotlib is not installed.")
-    print("Install with: pip install matplotlib numpy")
-    sys.exit(1)
+from plot_utils import import_pyplot, save_png_and_pdf, uniform_test_names
+from project_paths import SCRIPT_DIR
 
-PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
-PROJECT_ROOT = os.path.dirname(PROJECT_ROOT)
+plt = import_pyplot()
+import numpy as np  # always installed alongside matplotlib
 
-CSV_FILE = os.path.join(PROJECT_ROOT, "part_D", "exact_vs_greedy_comparison.csv")
-PNG_FILE = os.path.join(PROJECT_ROOT, "part_D", "greedy_quality_bar_chart.png")
-PDF_FILE = os.path.join(PROJECT_ROOT, "part_D", "greedy_quality_bar_chart.pdf")
+CSV_FILE = os.path.join(SCRIPT_DIR, "exact_vs_greedy_comparison.csv")
+PNG_FILE = os.path.join(SCRIPT_DIR, "greedy_quality_bar_chart.png")
+PDF_FILE = os.path.join(SCRIPT_DIR, "greedy_quality_bar_chart.pdf")
+
+
+# Bar colours by quality: QUALITY_PALETTE[i] is used from QUALITY_THRESHOLDS[i - 1]
+# (inclusive) up to QUALITY_THRESHOLDS[i]
+QUALITY_THRESHOLDS = np.array([90, 95, 99.9])
+QUALITY_PALETTE = np.array([
+    '#e74c3c',  # Poor (<90%): red
+    '#e67e22',  # Fair (90-95%): dark orange
+    '#f39c12',  # Good (95-99.9%): orange
+    '#2ecc71',  # Optimal (100%): green
+])
+
+# Columns of the comparison data returned by read_data
+COLUMNS = ("test_name", "vertices", "edges",
+           "exact_value", "greedy_value", "quality_percent")
 
 
 def read_data():
-    """Read comparison data from CSV."""
+    """Read comparison data from CSV into a dict of columns (name -> list)."""
     if not os.path.exists(CSV_FILE):
         print(f"Error: {CSV_FILE} not found.")
         print("Please run generate_exact_vs_greedy.py first.")
         sys.exit(1)
 
-    data = []
-    with open(CSV_FILE, "r") as f:
-        reader = csv.DictReader(f)
+    rows = []
+    with open(CSV_FILE, "r", newline="") as f:
+        # Plain csv.reader: look the columns up once from the header instead
+        # of building a DictReader dict for every row
+        reader = csv.reader(f)
+        header = next(reader, [])
+        missing = [name for name in COLUMNS if name not in header]
+        if missing:
+            print(f"Error: {CSV_FILE} is missing column(s): {', '.join(missing)}")
+            sys.exit(1)
+        i_name, i_v, i_e, i_exact, i_greedy, i_quality = map(header.index, COLUMNS)
         for row in reader:
-            data.append({
-                "test_name": row["test_name"],
-                "vertices": int(row["vertices"]),
-                "edges": int(row["edges"]),
-                "exact_value": int(row["exact_value"]),
-                "greedy_value": int(row["greedy_value"]),
-                "quality_percent": float(row["quality_percent"]),
-            })
-
-    if not data:
+            # Blank lines (e.g. a trailing one) come back as empty rows,
+            # which DictReader used to skip
+            if not row:
+                continue
+            rows.append((row[i_name], int(row[i_v]), int(row[i_e]),
+                         int(row[i_exact]), int(row[i_greedy]),
+                         float(row[i_quality])))
+
+    if not rows:
         print("No data found in CSV file.")
         sys.exit(1)
 
-    # Sort by complexity: edges first, then vertices
-    data.sort(key=lambda d: (d["edges"], d["vertices"]))
-    return data
+    # Sort by complexity: edges first, then vertices; then transpose once so
+    # the chart takes whole columns
+    rows.sort(key=itemgetter(2, 1))
+    return dict(zip(COLUMNS, map(list, zip(*rows))))
 
 
 def plot_quality_bar_chart(data):
     """Create bar chart showing quality percentage."""
     # Create uniform test names
-    size_counts = {}
-    uniform_names = []
-    for d in data:
-        v = d["vertices"]
-        e = d["edges"]
-        key = (v, e)
-        if key not in size_counts:
-            size_counts[key] = 0
-        size_counts[key] += 1
-        count = size_counts[key]
-
-        if count == 1:
-            uniform_names.append(f"{v}v_{e}")
-        else:
-            uniform_names.append(f"{v}v_{e}_{count}")
-
-    quality_percentages = [d["quality_percent"] for d in data]
-    exact_values = [d["exact_value"] for d in data]
-    greedy_values = [d["greedy_value"] for d in data]
-
-    # Color bars: green for 100%, orange to red gradient for suboptimal
-    bar_colors = []
-    for pct in quality_percentages:
-        if pct >= 99.9:  # Optimal (100%)
-            bar_colors.append('#2ecc71')  # Green
-        elif pct >= 95:  # Good (95-99.9%)
-            bar_colors.append('#f39c12')  # Orange
-        elif pct >= 90:  # Fair (90-95%)
-            bar_colors.append('#e67e22')  # Dark orange
-        else:  # Poor (<90%)
-            bar_colors.append('#e74c3c')  # Red
-
-    fig, ax = plt.subplots(1, 1, figsize=(max(16, len(data) * 0.65), 8))
-
-    x_pos = range(len(data))
-    bars = ax.bar(x_pos, quality_percentages, color=bar_colors, alpha=0.8, 
-                  edgecolor='black', linewidth=1.5, width=0.6)
+    uniform_names = uniform_test_names(data["vertices"], data["edges"])
+
+    quality_percentages = data["quality_percent"]
+    exact_values = data["exact_value"]
+    greedy_values = data["greedy_value"]
+    n_tests = len(quality_percentages)
+
+    # Color bars: green for 100%, orange to red gradient for suboptimal.
+    # Each threshold a percentage reaches moves it one colour up the palette
+    bar_colors = QUALITY_PALETTE[
+        np.searchsorted(QUALITY_THRESHOLDS, quality_percentages, side='right')
+    ].tolist()
+
+    fig, ax = plt.subplots(1, 1, figsize=(max(16, n_tests * 0.65), 8))
+
+    x_pos = range(n_tests)
+    ax.bar(x_pos, quality_percentages, color=bar_colors, alpha=0.8, 
+           edgecolor='black', linewidth=1.5, width=0.6)
 
     # Add 100% reference line
     ax.axhline(y=100, color='red', linestyle='--', linewidth=2.5, 
                label='100% (Optimal)', alpha=0.8, zorder=0)
 
-    # Add percentage labels on bars
-    for i, (bar, pct, exact_val, greedy_val) in enumerate(
-        zip(bars, quality_percentages, exact_values, greedy_values)
+    # Add percentage labels on bars; bars are centred on x_pos with height
+    # equal to their percentage, so read positions from the data directly.
+    # The value-label box style is the same for every bar (Text copies it)
+    value_label_bbox = dict(boxstyle='round,pad=0.3', facecolor='white',
+                            alpha=0.7, edgecolor='gray', linewidth=0.5)
+    for x_center, pct, exact_val, greedy_val in zip(
+        x_pos, quality_percentages, exact_values, greedy_values
     ):
-        height = bar.get_height()
-        x_center = bar.get_x() + bar.get_width()/2.
+        height = pct
 
         # Percentage label above bar
         label_y = height + 0.5 if height < 99.5 else height + 0.2
@@ -114,8 +117,7 @@ def plot_quality_bar_chart(data):
         if height > 87:
             ax.text(x_center, max(87, height - 1.5), f'{exact_val}/{greedy_val}', 
                     ha='center', va='top', fontsize=7,
-                    bbox=dict(boxstyle='round,pad=0.3', facecolor='white', 
-                    alpha=0.7, edgecolor='gray', linewidth=0.5))
+                    bbox=value_label_bbox)
 
     ax.set_xlabel("Test Case", fontsize=12, fontweight="bold")
     ax.set_ylabel("Solution Quality (% of optimal)", fontsize=12, fontweight="bold")
@@ -134,8 +136,8 @@ def plot_quality_bar_chart(data):
     max_quality = max(quality_percentages)
     
     stats_text = f"Statistics:\n"
-    stats_text += f"Total Tests: {len(data)}\n"
-    stats_text += f"Optimal (100%): {optimal_count} ({optimal_count/len(data)*100:.1f}%)\n"
+    stats_text += f"Total Tests: {n_tests}\n"
+    stats_text += f"Optimal (100%): {optimal_count} ({optimal_count/n_tests*100:.1f}%)\n"
     stats_text += f"Avg Quality: {avg_quality:.2f}%\n"
     stats_text += f"Range: {min_quality:.2f}% - {max_quality:.2f}%"
     
@@ -145,8 +147,7 @@ def plot_quality_bar_chart(data):
             family='monospace')
 
     plt.tight_layout()
-    plt.savefig(PNG_FILE, dpi=300, bbox_inches="tight")
-    plt.savefig(PDF_FILE, bbox_inches="tight")
+    save_png_and_pdf(fig, PNG_FILE, PDF_FILE)
     print(f"Bar chart saved to:\n  {PNG_FILE}\n  {PDF_FILE}")
     plt.close()
 
@@ -160,7 +161,7 @@ def main():
     print("Reading data from CSV...")
     data = read_data()
 
-    print(f"Loaded {len(data)} test cases")
+    print(f"Loaded {len(data['test_name'])} test cases")
     print("Generating bar chart...")
     plot_quality_bar_chart(data)
 
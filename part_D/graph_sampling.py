@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Random edge sampling shared by the test case generators (Part D additional
+tests, Part E test cases and the timing tests).
+"""
+
+import math
+
+
+def edge_from_index(n, idx, vertices):
+    """
+    Return the idx-th pair of the list [(vertices[i], vertices[j]) for i < j]
+    without building the list.
+
+    Row i starts at offset i * (2n - i - 1) / 2; counting rows from the end
+    turns that into a triangular number, which isqrt inverts exactly.
+    """
+    num_pairs = n * (n - 1) // 2
+    i = n - 2 - (math.isqrt(8 * (num_pairs - 1 - idx) + 1) - 1) // 2
+    j = idx + i + 1 - i * (2 * n - i - 1) // 2
+    return vertices[i], vertices[j]
+
+
+def sample_pairs(rng, n, m, vertices):
+    """
+    Return m distinct (u, v) pairs drawn from the (i, j), i < j, pair list
+    of vertices, using rng (a random.Random, or the random module itself).
+
+    Positions are sampled and mapped back with edge_from_index instead of
+    building the list; random.sample on a range picks the same positions it
+    would pick from the materialized list, so the pairs are unchanged.
+    """
+    return [edge_from_index(n, idx, vertices)
+            for idx in rng.sample(range(n * (n - 1) // 2), m)]
+
+
+def sample_weighted_edges(rng, n, m, vertices, weight_range):
+    """
+    Return m (u, v, w) edges: the pairs from sample_pairs, each followed by
+    a weight drawn from weight_range (inclusive).
+
+    Weights come from rng.randrange(low, high + 1), which is what randint
+    calls, so the draws match one randint per edge.
+    """
+    pairs = sample_pairs(rng, n, m, vertices)
+    randrange = rng.randrange
+    low, high = weight_range[0], weight_range[1] + 1
+    return [(u, v, randrange(low, high)) for u, v in pairs]
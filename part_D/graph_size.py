@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Read the "n m" header of a test case file, shared by the Part D scripts.
+"""
+
+import os
+
+# Bytes read per os.read() when looking for the "n m" header line
+HEADER_READ_BYTES = 64
+
+
+def read_graph_size(path):
+    """
+    Read first line of a test file and return (n_vertices, n_edges),
+    or (0, 0) if the file cannot be read or has no valid header.
+    """
+    try:
+        # Only the "n m" header is needed: raw os.read of a small block
+        # skips the buffered file object and any text decoding
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            head = os.read(fd, HEADER_READ_BYTES)
+            while b"\n" not in head:
+                more = os.read(fd, HEADER_READ_BYTES)
+                if not more:
+                    break
+                head += more
+        finally:
+            os.close(fd)
+        parts = head.split(b"\n", 1)[0].split()
+        if len(parts) < 2:
+            return 0, 0
+        return int(parts[0]), int(parts[1])
+    except (OSError, ValueError):
+        return 0, 0
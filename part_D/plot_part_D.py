@@ -14,27 +14,32 @@ Outputs are written into the `part_D` folder as PNG and PDF files.
 
 import os
 import sys
+from operator import itemgetter
 
-try:
-    import matplotlib.pyplot as plt
-except ImportError:
-    print("Error: matplotlib is not installed.")
-    print("Install with one of the following commands:")
-    print("  pip install matplotlib")
-    print("  # or")
-    print("  conda install matplotlib")
-    sys.exit(1)
+from plot_utils import import_pyplot, save_png_and_pdf, uniform_test_names
+from project_paths import PROJECT_ROOT, SCRIPT_DIR
+
+plt = import_pyplot()
+
+
+# Columns of the comparison data, in the order of the fields on each line
+COLUMNS = ("test_name", "vertices", "edges", "exact_time", "approx_time",
+           "exact_value", "approx_value", "quality", "difference",
+           "percent_diff", "speedup")
 
 
 def read_comparison_data(path):
-    """Read comparison data into a list of dicts."""
+    """
+    Read comparison data into a dict of columns (column name -> list),
+    with every column in the same row order.
+    """
     if not os.path.exists(path):
         print(f"Error: {path} not found.")
         print("Make sure you run `bash compare_solutions_detailed.sh` "
               "from the project root first.")
         sys.exit(1)
 
-    data = []
+    rows = []
     with open(path, "r") as f:
         for line in f:
             line = line.strip()
@@ -59,75 +64,53 @@ def read_comparison_data(path):
             except ValueError:
                 continue
 
-            data.append(
-                {
-                    "test_name": test_name,
-                    "vertices": vertices,
-                    "edges": edges,
-                    "exact_time": exact_time,
-                    "approx_time": approx_time,
-                    "exact_value": exact_value,
-                    "approx_value": approx_value,
-                    "quality": quality,
-                    "difference": difference,
-                    "percent_diff": percent_diff,
-                    "speedup": speedup,
-                }
-            )
-
-    if not data:
+            rows.append((test_name, vertices, edges, exact_time, approx_time,
+                         exact_value, approx_value, quality, difference,
+                         percent_diff, speedup))
+
+    if not rows:
         print(f"No usable rows found in {path}.")
         sys.exit(1)
 
-    # Sort by number of vertices so plots look clean
-    data.sort(key=lambda d: d["vertices"])
-    return data
+    # Sort once for every plot, by complexity: edges first (main driver of
+    # complexity), then vertices, so the runtime graphs increase smoothly.
+    # Then transpose once, so the plots take whole columns instead of
+    # pulling each one out of per-row dicts
+    rows.sort(key=itemgetter(2, 1))
+    return dict(zip(COLUMNS, map(list, zip(*rows))))
 
 
 def plot_runtime(data, out_dir):
-    """Plot runtime (wall clock) of exact vs approx as line graph with linear scale (decimal seconds)."""
-    # Sort data by complexity: edges first (main driver of complexity), then vertices
-    # This ensures the runtime graph increases smoothly
-    data_sorted = sorted(data, key=lambda d: (d["edges"], d["vertices"]))
-    
-    vertices = [d["vertices"] for d in data_sorted]
-    exact_times = [d["exact_time"] for d in data_sorted]
-    approx_times = [d["approx_time"] for d in data_sorted]
+    """
+    Plot runtime (wall clock) of exact vs approx as line graph with linear scale (decimal seconds).
+    Expects data in the order produced by read_comparison_data.
+    """
+    exact_times = data["exact_time"]
+    approx_times = data["approx_time"]
+    n_tests = len(exact_times)
     
-    # Create uniform test names for x-axis labels in the same order as data_sorted
-    # Track counts for each (v, e) combination to handle duplicates
-    size_counts = {}
-    uniform_names = []
-    for d in data_sorted:
-        v = d["vertices"]
-        e = d["edges"]
-        key = (v, e)
-        if key not in size_counts:
-            size_counts[key] = 0
-        size_counts[key] += 1
-        count = size_counts[key]
-        
-        if count == 1:
-            uniform_names.append(f"{v}v_{e}")
-        else:
-            uniform_names.append(f"{v}v_{e}_{count}")
+    # Create uniform test names for x-axis labels
+    uniform_names = uniform_test_names(data["vertices"], data["edges"])
 
-    fig, ax = plt.subplots(1, 1, figsize=(max(16, len(data_sorted) * 0.65), 8))
+    fig, ax = plt.subplots(1, 1, figsize=(max(16, n_tests * 0.65), 8))
     
-    x_pos = range(len(data_sorted))
+    x_pos = range(n_tests)
     
     # Plot as line graph
     line1 = ax.plot(x_pos, exact_times, "ro-", label="Exact (optimal)", linewidth=2.5, markersize=8, alpha=0.8)
     line2 = ax.plot(x_pos, approx_times, "gs-", label="Approximation", linewidth=2.5, markersize=8, alpha=0.8)
     
-    # Add decimal values in parentheses next to each point
+    # Add decimal values in parentheses next to each point; the labels sit
+    # inside the axes, so layout/bbox passes needn't measure each one
     for i, (x, exact_t, approx_t) in enumerate(zip(x_pos, exact_times, approx_times)):
         # Label for exact (above point)
         ax.text(x, exact_t, f'({exact_t:.3f})', 
-                ha='center', va='bottom', fontsize=7, color='red', alpha=0.8)
+                ha='center', va='bottom', fontsize=7, color='red', alpha=0.8,
+                in_layout=False)
         # Label for approx (above point)
         ax.text(x, approx_t, f'({approx_t:.3f})', 
-                ha='center', va='bottom', fontsize=7, color='green', alpha=0.8)
+                ha='center', va='bottom', fontsize=7, color='green', alpha=0.8,
+                in_layout=False)
     
     ax.set_xlabel("Test Case", fontsize=12, fontweight='bold')
     ax.set_ylabel("Runtime (seconds, log scale)", fontsize=12, fontweight='bold')
@@ -142,51 +125,36 @@ def plot_runtime(data, out_dir):
     png_path = os.path.join(out_dir, "part_D_runtime_comparison.png")
     pdf_path = os.path.join(out_dir, "part_D_runtime_comparison.pdf")
     plt.tight_layout()
-    plt.savefig(png_path, dpi=300, bbox_inches='tight')
-    plt.savefig(pdf_path, bbox_inches='tight')
+    save_png_and_pdf(fig, png_path, pdf_path)
     print(f"Saved runtime comparison plots to:\n  {png_path}\n  {pdf_path}")
     plt.close()
 
 
 def plot_runtime_exact_only(data, out_dir):
-    """Plot runtime (wall clock) of exact solution only as line graph with log scale."""
-    # Sort data by complexity: edges first (main driver of complexity), then vertices
-    # This ensures the runtime graph increases smoothly
-    data_sorted = sorted(data, key=lambda d: (d["edges"], d["vertices"]))
-    
-    vertices = [d["vertices"] for d in data_sorted]
-    exact_times = [d["exact_time"] for d in data_sorted]
+    """
+    Plot runtime (wall clock) of exact solution only as line graph with log scale.
+    Expects data in the order produced by read_comparison_data.
+    """
+    exact_times = data["exact_time"]
+    n_tests = len(exact_times)
     
-    # Create uniform test names for x-axis labels in the same order as data_sorted
-    # Track counts for each (v, e) combination to handle duplicates
-    size_counts = {}
-    uniform_names = []
-    for d in data_sorted:
-        v = d["vertices"]
-        e = d["edges"]
-        key = (v, e)
-        if key not in size_counts:
-            size_counts[key] = 0
-        size_counts[key] += 1
-        count = size_counts[key]
-        
-        if count == 1:
-            uniform_names.append(f"{v}v_{e}")
-        else:
-            uniform_names.append(f"{v}v_{e}_{count}")
+    # Create uniform test names for x-axis labels
+    uniform_names = uniform_test_names(data["vertices"], data["edges"])
 
-    fig, ax = plt.subplots(1, 1, figsize=(max(16, len(data_sorted) * 0.65), 8))
+    fig, ax = plt.subplots(1, 1, figsize=(max(16, n_tests * 0.65), 8))
     
-    x_pos = range(len(data_sorted))
+    x_pos = range(n_tests)
     
     # Plot as line graph - exact only
     ax.plot(x_pos, exact_times, "ro-", label="Exact (optimal)", linewidth=2.5, markersize=8, alpha=0.8)
     
-    # Add decimal values in parentheses next to each point
+    # Add decimal values in parentheses next to each point; the labels sit
+    # inside the axes, so layout/bbox passes needn't measure each one
     for i, (x, exact_t) in enumerate(zip(x_pos, exact_times)):
         # Label for exact (above point)
         ax.text(x, exact_t, f'({exact_t:.3f})', 
-                ha='center', va='bottom', fontsize=7, color='red', alpha=0.8)
+                ha='center', va='bottom', fontsize=7, color='red', alpha=0.8,
+                in_layout=False)
     
     ax.set_xlabel("Test Case", fontsize=12, fontweight='bold')
     ax.set_ylabel("Runtime (seconds, log scale)", fontsize=12, fontweight='bold')
@@ -201,8 +169,7 @@ def plot_runtime_exact_only(data, out_dir):
     png_path = os.path.join(out_dir, "part_D_runtime_exact_only.png")
     pdf_path = os.path.join(out_dir, "part_D_runtime_exact_only.pdf")
     plt.tight_layout()
-    plt.savefig(png_path, dpi=300, bbox_inches='tight')
-    plt.savefig(pdf_path, bbox_inches='tight')
+    save_png_and_pdf(fig, png_path, pdf_path)
     print(f"Saved exact-only runtime plot to:\n  {png_path}\n  {pdf_path}")
     plt.close()
 
@@ -211,38 +178,20 @@ def plot_quality(data, out_dir):
     """
     Plot solution quality as bar chart only (no line graph).
     Shows approximation performance as percentage of optimal.
+    Expects data in the order produced by read_comparison_data.
     """
-    # Sort data by complexity: edges first (main driver of complexity), then vertices
-    # This ensures consistent ordering across all plots
-    data_sorted = sorted(data, key=lambda d: (d["edges"], d["vertices"]))
+    # Create uniform test names
+    uniform_names = uniform_test_names(data["vertices"], data["edges"])
     
-    # Create uniform test names in the same order as data_sorted
-    # Track counts for each (v, e) combination to handle duplicates
-    size_counts = {}
-    uniform_names = []
-    for d in data_sorted:
-        v = d["vertices"]
-        e = d["edges"]
-        key = (v, e)
-        if key not in size_counts:
-            size_counts[key] = 0
-        size_counts[key] += 1
-        count = size_counts[key]
-        
-        if count == 1:
-            uniform_names.append(f"{v}v_{e}")
-        else:
-            uniform_names.append(f"{v}v_{e}_{count}")
-    
-    vertices = [d["vertices"] for d in data_sorted]
-    exact_vals = [d["exact_value"] for d in data_sorted]
-    approx_vals = [d["approx_value"] for d in data_sorted]
-    qualities = [d["quality"] for d in data_sorted]
+    exact_vals = data["exact_value"]
+    approx_vals = data["approx_value"]
+    qualities = data["quality"]
     test_names = uniform_names
+    n_tests = len(qualities)
     
     # Calculate error percentage for each test
     error_percentages = []
-    for i in range(len(data_sorted)):
+    for i in range(n_tests):
         if exact_vals[i] > 0:
             err_pct = (approx_vals[i] / exact_vals[i]) * 100.0
             error_percentages.append(err_pct)
@@ -250,24 +199,26 @@ def plot_quality(data, out_dir):
             error_percentages.append(0.0)
     
     # Create single figure with moderate spacing
-    fig, ax = plt.subplots(1, 1, figsize=(max(16, len(data_sorted) * 0.65), 8))
+    fig, ax = plt.subplots(1, 1, figsize=(max(16, n_tests * 0.65), 8))
     
     # Color bars by quality
     bar_colors = ['#2ecc71' if q == 'OPTIMAL' else '#e67e22' for q in qualities]  # Green for optimal, orange for suboptimal
     
     # Create bars with moderate spacing (thinner bars, closer together than before but not as close as original)
-    x_pos = range(len(data_sorted))
-    bars = ax.bar(x_pos, error_percentages, color=bar_colors, alpha=0.8, 
-                  edgecolor='black', linewidth=1.5, width=0.6)
+    x_pos = range(n_tests)
+    ax.bar(x_pos, error_percentages, color=bar_colors, alpha=0.8, 
+           edgecolor='black', linewidth=1.5, width=0.6)
     
     # Add 100% reference line
     ax.axhline(y=100, color='red', linestyle='--', linewidth=2.5, 
                label='100% (Perfect)', alpha=0.8, zorder=0)
     
-    # Add value labels on bars - percentage above, values below
-    for i, (bar, err_pct, exact_val, approx_val) in enumerate(zip(bars, error_percentages, exact_vals, approx_vals)):
-        height = bar.get_height()
-        x_center = bar.get_x() + bar.get_width()/2.
+    # Add value labels on bars - percentage above, values below. Bars are
+    # centred on x_pos with height err_pct, so use the data directly.
+    # The value-label box style is the same for every bar (Text copies it)
+    value_label_bbox = dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.7, edgecolor='gray', linewidth=0.5)
+    for x_center, err_pct, exact_val, approx_val in zip(x_pos, error_percentages, exact_vals, approx_vals):
+        height = err_pct
         
         # Percentage label above bar
         label_y = height + 0.3 if height < 99.5 else height + 0.15
@@ -282,7 +233,7 @@ def plot_quality(data, out_dir):
             ax.text(x_center, value_y,
                     f'{exact_val}/{approx_val}',
                     ha='center', va='top', fontsize=7,
-                    bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.7, edgecolor='gray', linewidth=0.5))
+                    bbox=value_label_bbox)
     
     # Create x-axis labels with uniform format
     x_labels = []
@@ -306,8 +257,8 @@ def plot_quality(data, out_dir):
     min_error = min(error_percentages)
     max_error = max(error_percentages)
     stats_text = f"Statistics:\n"
-    stats_text += f"Total Tests: {len(data_sorted)}\n"
-    stats_text += f"Optimal: {optimal_count} ({optimal_count/len(data_sorted)*100:.1f}%)\n"
+    stats_text += f"Total Tests: {n_tests}\n"
+    stats_text += f"Optimal: {optimal_count} ({optimal_count/n_tests*100:.1f}%)\n"
     stats_text += f"Avg Quality: {avg_error:.2f}%\n"
     stats_text += f"Range: {min_error:.2f}% - {max_error:.2f}%"
     ax.text(0.01, 0.99, stats_text, transform=ax.transAxes,
@@ -319,32 +270,31 @@ def plot_quality(data, out_dir):
     
     png_path = os.path.join(out_dir, "part_D_solution_quality.png")
     pdf_path = os.path.join(out_dir, "part_D_solution_quality.pdf")
-    plt.savefig(png_path, dpi=300, bbox_inches='tight')
-    plt.savefig(pdf_path, bbox_inches='tight')
+    save_png_and_pdf(fig, png_path, pdf_path)
     print(f"Saved solution-quality plot (bar chart only) to:\n  {png_path}\n  {pdf_path}")
     plt.close()
 
 
 def main():
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    # project root is the parent of part_D
-    project_root = os.path.dirname(script_dir)
-
-    # Prefer the Part D averaged data if it exists; otherwise fall back
-    part_d_data = os.path.join(script_dir, "comparison_data_part_D.txt")
-    if os.path.exists(part_d_data):
+    # Prefer the Part D averaged data if it exists (in-process timings first);
+    # otherwise fall back
+    inprocess_data = os.path.join(SCRIPT_DIR, "comparison_data_part_D_inprocess.txt")
+    part_d_data = os.path.join(SCRIPT_DIR, "comparison_data_part_D.txt")
+    if os.path.exists(inprocess_data):
+        data_path = inprocess_data
+    elif os.path.exists(part_d_data):
         data_path = part_d_data
     else:
-        data_path = os.path.join(project_root, "comparison_data.txt")
+        data_path = os.path.join(PROJECT_ROOT, "comparison_data.txt")
 
     data = read_comparison_data(data_path)
 
-    print(f"Loaded {len(data)} comparison rows from {data_path}")
+    print(f"Loaded {len(data['test_name'])} comparison rows from {data_path}")
     print("Generating Part D plots...")
 
-    plot_runtime(data, script_dir)
-    plot_runtime_exact_only(data, script_dir)
-    plot_quality(data, script_dir)
+    plot_runtime(data, SCRIPT_DIR)
+    plot_runtime_exact_only(data, SCRIPT_DIR)
+    plot_quality(data, SCRIPT_DIR)
 
     print("Done.")
 
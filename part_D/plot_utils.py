@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the Part D plotting scripts.
+"""
+
+import sys
+from collections import defaultdict
+
+
+def import_pyplot():
+    """
+    Import and return matplotlib.pyplot, exiting with install instructions
+    if matplotlib is missing.
+
+    Scripts that also collect data call this only when they actually plot,
+    so the (slow) pyplot import is skipped with --no-plot. The plots are
+    only ever saved to files, so the Agg backend is selected up front
+    instead of letting pyplot probe for an interactive one (Qt/Tk).
+    """
+    try:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print("Error: matplotlib is not installed.")
+        print("Install with: pip install matplotlib")
+        sys.exit(1)
+    return plt
+
+
+def uniform_test_names(vertices, edges):
+    """
+    Return a uniform "Nv_M" label for each test, given its vertex and edge
+    counts as two parallel sequences.
+
+    The first test of a given (vertices, edges) size is labelled "Nv_M";
+    later tests of the same size get a running suffix: "Nv_M_2", "Nv_M_3", ...
+    """
+    size_counts = defaultdict(int)
+    names = []
+    for v, e in zip(vertices, edges):
+        size_counts[v, e] += 1
+        count = size_counts[v, e]
+        names.append(f"{v}v_{e}" if count == 1 else f"{v}v_{e}_{count}")
+    return names
+
+
+def save_png_and_pdf(fig, png_path, pdf_path, dpi=300):
+    """
+    Save fig as a PNG at dpi and as a PDF, both cropped to the tight bbox.
+
+    savefig(bbox_inches="tight") lays out the whole figure once just to
+    measure it, on every call. The bbox is measured once here, at the PNG
+    dpi so the PNG is identical to the "tight" one, and passed to both saves.
+    """
+    from matplotlib import rcParams
+
+    original_dpi = fig.dpi
+    fig.dpi = dpi
+    try:
+        fig.draw_without_rendering()
+        bbox = fig.get_tightbbox(fig.canvas.get_renderer())
+    finally:
+        fig.dpi = original_dpi
+    bbox = bbox.padded(rcParams["savefig.pad_inches"])
+
+    fig.savefig(png_path, dpi=dpi, bbox_inches=bbox)
+    fig.savefig(pdf_path, bbox_inches=bbox)
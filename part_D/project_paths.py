@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""
+Project paths shared by the Part D scripts, resolved once per process.
+"""
+
+import os
+
+# part_D itself, and the project root one level up
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
+
+EXACT_SCRIPT = os.path.join(PROJECT_ROOT, "exact_solution", "cs412_longestpath_exact.py")
+APPROX_SCRIPT = os.path.join(PROJECT_ROOT, "approx_solution", "cs412_longestpath_approx.py")
+
+TEST_DIR = os.path.join(SCRIPT_DIR, "additional_test_cases")
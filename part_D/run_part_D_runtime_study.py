@@ -5,30 +5,38 @@ Part D runtime study:
 - Runs the exact and approximation solvers on a wider variety of test cases,
   including timing tests.
 - Repeats each run multiple times and averages wall-clock runtime to smooth noise.
+  Runs go one at a time unless --workers is raised; concurrent runs contend
+  for the CPU and inflate each other's timings.
+  Solvers are called in-process (see solver_runner.py), so the runtimes do
+  not include Python interpreter startup and are not comparable with the
+  subprocess-timed rows in comparison_data_part_D.txt, so they are written
+  to separate *_inprocess files. Tests that already have a row there are
+  skipped and new rows are appended.
 - Writes a comparison data file in the same format as `comparison_data.txt`:
 
   test_name|vertices|edges|exact_time|approx_time|exact_length|approx_length|quality|diff|percent|speedup
 
-Output file:
-  part_D/comparison_data_part_D.txt
+Output files:
+  part_D/comparison_data_part_D_inprocess.txt
+  part_D/comparison_runs_part_D_inprocess.txt (every individual run)
 
 You can then generate plots with:
   python3 part_D/plot_part_D.py
 """
 
+import argparse
 import os
-import subprocess
-import time
 import math
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
 
-PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))  # this is part_D
-PROJECT_ROOT = os.path.dirname(PROJECT_ROOT)  # actual project root
+from graph_size import read_graph_size
+from project_paths import APPROX_SCRIPT, EXACT_SCRIPT, PROJECT_ROOT, SCRIPT_DIR, TEST_DIR
+from solver_runner import run_solver
 
-EXACT_SCRIPT = os.path.join(PROJECT_ROOT, "exact_solution", "cs412_longestpath_exact.py")
-APPROX_SCRIPT = os.path.join(PROJECT_ROOT, "approx_solution", "cs412_longestpath_approx.py")
-
-OUTPUT_FILE = os.path.join(PROJECT_ROOT, "part_D", "comparison_data_part_D.txt")
-RUNS_LOG_FILE = os.path.join(PROJECT_ROOT, "part_D", "comparison_runs_part_D.txt")
+OUTPUT_FILE = os.path.join(SCRIPT_DIR, "comparison_data_part_D_inprocess.txt")
+RUNS_LOG_FILE = os.path.join(SCRIPT_DIR, "comparison_runs_part_D_inprocess.txt")
 
 # Number of times to repeat each run to average runtime
 REPEATS = 5
@@ -41,89 +49,65 @@ APPROX_TIMEOUT = 30.0
 # Format: (max_vertices, max_edges) - skip if test exceeds both
 MAX_TEST_SIZE = (11, 55)  # Skip anything with >11 vertices OR >55 edges
 
-
-def read_graph_size(path):
-    """Read first line of a test file and return (n_vertices, n_edges)."""
-    with open(path, "r") as f:
-        first = f.readline().strip()
-    if not first:
-        return 0, 0
-    parts = first.split()
-    if len(parts) < 2:
-        return 0, 0
-    try:
-        n = int(parts[0])
-        m = int(parts[1])
-    except ValueError:
-        return 0, 0
-    return n, m
+# Cached: each test is sized once when collected and again when run
+read_graph_size = lru_cache(maxsize=None)(read_graph_size)
 
 
-def run_solver(script, input_path, timeout):
+def scan_dir(directory):
     """
-    Run a solver once on a given input file.
-    Returns (success, runtime_seconds, path_length_int_or_0).
+    Return {file name: path} for the files in directory (empty if it does
+    not exist), from one os.scandir pass instead of a join + exists per name.
     """
-    start = time.time()
-    try:
-        proc = subprocess.run(
-            ["python3", script, input_path],
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-        )
-        elapsed = time.time() - start
-    except subprocess.TimeoutExpired:
-        return False, timeout, 0
-    except Exception:
-        return False, 0.0, 0
-
-    if proc.returncode != 0:
-        return False, elapsed, 0
-
-    lines = proc.stdout.strip().splitlines()
-    if not lines:
-        return False, elapsed, 0
-
     try:
-        length = int(lines[0].strip().split()[0])
-    except ValueError:
-        length = 0
+        with os.scandir(directory) as entries:
+            return {entry.name: entry.path for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return {}
 
-    return True, elapsed, length
 
-
-def avg_over_repeats(script, input_path, timeout, repeats, solver_name, test_name, runs_log):
+def avg_over_repeats(results, timeout, solver_name, test_name, runs_log):
     """
-    Run solver multiple times and return (avg_time, length_from_best_run).
-    Also logs each individual run (non-averaged) to runs_log.
+    Average the repeated runs of one solver on one test and return
+    (avg_time, length_from_best_run). results yields the run_solver result
+    of each repeat, in order.
+    Also logs each individual run (non-averaged) to runs_log, with one
+    writelines() per call.
     """
-    times = []
+    total_time = 0.0
+    run_count = 0
+    log_lines = []
     best_len = 0
-    for i in range(repeats):
-        run_idx = i + 1
-        success, t, length = run_solver(script, input_path, timeout)
+    for run_idx, (success, t, length) in enumerate(results, 1):
         if not success:
             # Treat as timeout for averaging/logging
             t = timeout
             length = 0
-        times.append(t)
+        total_time += t
+        run_count += 1
         if length > best_len:
             best_len = length
         # Log this individual run
-        runs_log.write(
+        log_lines.append(
             f"{test_name}|{solver_name}|run_{run_idx}|{t:.6f}|{length}\n"
         )
-    avg_time = sum(times) / len(times) if times else 0.0
+    runs_log.writelines(log_lines)
+    avg_time = total_time / run_count if run_count else 0.0
     return avg_time, best_len
 
 
 def main():
+    parser = argparse.ArgumentParser(
+        description="Run the exact and approximation solvers on the Part D runtime study tests.")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="solver runs to keep going at once (default: 1); more than "
+                             "one makes runs share the CPU, which skews their timings")
+    args = parser.parse_args()
+
     # Collect a mix of small/medium/large-ish cases
     tests = []
 
     # Existing comparison tests from approx_solution/test_cases
-    approx_cases_dir = os.path.join(PROJECT_ROOT, "approx_solution", "test_cases")
+    approx_cases = scan_dir(os.path.join(PROJECT_ROOT, "approx_solution", "test_cases"))
     base_cases = [
         "test_small_1",
         "test_small_2",
@@ -133,12 +117,11 @@ def main():
         "test_nonoptimal",
     ]
     for name in base_cases:
-        path = os.path.join(approx_cases_dir, name)
-        if os.path.exists(path):
-            tests.append(path)
+        if name in approx_cases:
+            tests.append(approx_cases[name])
 
     # Add some manageable test cases from exact_solution/test_cases
-    exact_cases_dir = os.path.join(PROJECT_ROOT, "exact_solution", "test_cases")
+    exact_case_files = scan_dir(os.path.join(PROJECT_ROOT, "exact_solution", "test_cases"))
     exact_cases = [
         "test_input_1",      # 3 vertices, 3 edges
         "test_input_2",      # 4 vertices, 6 edges
@@ -152,8 +135,8 @@ def main():
         "test_input_medium_2",
     ]
     for name in exact_cases:
-        path = os.path.join(exact_cases_dir, name)
-        if os.path.exists(path):
+        path = exact_case_files.get(name)
+        if path is not None:
             n, m = read_graph_size(path)
             # Only add if not too large
             if n <= MAX_TEST_SIZE[0] and m <= MAX_TEST_SIZE[1]:
@@ -163,30 +146,25 @@ def main():
 
     # Timing tests (10–14 vertices, up to ~80 edges)
     # Filter out cases that are too large to avoid timeouts
-    timing_dir = os.path.join(PROJECT_ROOT, "timing_tests", "test_cases")
-    if os.path.isdir(timing_dir):
-        for fname in sorted(os.listdir(timing_dir)):
-            if fname.startswith("test_") and fname.endswith(".txt"):
-                path = os.path.join(timing_dir, fname)
-                n, m = read_graph_size(path)
-                # Skip if too large
-                if n > MAX_TEST_SIZE[0] or m > MAX_TEST_SIZE[1]:
-                    print(f"Skipping {fname}: {n} vertices, {m} edges (too large, will timeout)")
-                    continue
-                tests.append(path)
+    timing_files = scan_dir(os.path.join(PROJECT_ROOT, "timing_tests", "test_cases"))
+    for fname, path in sorted(timing_files.items()):
+        if fname.startswith("test_") and fname.endswith(".txt"):
+            n, m = read_graph_size(path)
+            # Skip if too large
+            if n > MAX_TEST_SIZE[0] or m > MAX_TEST_SIZE[1]:
+                print(f"Skipping {fname}: {n} vertices, {m} edges (too large, will timeout)")
+                continue
+            tests.append(path)
 
     # Additional test cases (8-11 vertices, 3 examples each)
-    additional_dir = os.path.join(PROJECT_ROOT, "part_D", "additional_test_cases")
-    if os.path.isdir(additional_dir):
-        for fname in sorted(os.listdir(additional_dir)):
-            if fname.endswith(".txt"):
-                path = os.path.join(additional_dir, fname)
-                n, m = read_graph_size(path)
-                # Skip if too large
-                if n > MAX_TEST_SIZE[0] or m > MAX_TEST_SIZE[1]:
-                    print(f"Skipping {fname}: {n} vertices, {m} edges (too large, will timeout)")
-                    continue
-                tests.append(path)
+    for fname, path in sorted(scan_dir(TEST_DIR).items()):
+        if fname.endswith(".txt"):
+            n, m = read_graph_size(path)
+            # Skip if too large
+            if n > MAX_TEST_SIZE[0] or m > MAX_TEST_SIZE[1]:
+                print(f"Skipping {fname}: {n} vertices, {m} edges (too large, will timeout)")
+                continue
+            tests.append(path)
 
     if not tests:
         print("No test cases found for Part D runtime study.")
@@ -200,12 +178,10 @@ def main():
     if os.path.exists(OUTPUT_FILE):
         with open(OUTPUT_FILE, "r") as f:
             for line in f:
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                parts = line.split("|")
-                if len(parts) >= 1:
-                    existing_tests.add(parts[0])
+                # Only the test name (the first field) is needed
+                name = line.lstrip().partition("|")[0].rstrip()
+                if name and not name.startswith("#"):
+                    existing_tests.add(name)
     
     # Filter to only new tests (those not in existing data)
     new_tests = [t for t in tests if os.path.basename(t) not in existing_tests]
@@ -221,7 +197,22 @@ def main():
     # Open file in append mode if we have existing data, otherwise write mode
     file_mode = "a" if existing_tests and tests_to_run else "w"
     
-    with open(OUTPUT_FILE, file_mode) as out, open(RUNS_LOG_FILE, "a" if existing_tests else "w") as runs_log:
+    # Every (test, solver, repeat) run is independent, so queue them all on a
+    # process pool up front. map() hands the results back in job order:
+    # REPEATS exact runs, then REPEATS approx runs, for each test in turn.
+    solvers = ((EXACT_SCRIPT, EXACT_TIMEOUT), (APPROX_SCRIPT, APPROX_TIMEOUT))
+    jobs = [
+        (script, path, timeout)
+        for path in tests_to_run
+        for script, timeout in solvers
+        for _ in range(REPEATS)
+    ]
+
+    with ProcessPoolExecutor(max_workers=args.workers) as executor, \
+            open(OUTPUT_FILE, file_mode) as out, \
+            open(RUNS_LOG_FILE, "a" if existing_tests else "w") as runs_log:
+        results = executor.map(run_solver, *zip(*jobs))
+
         # Only write header if starting fresh
         if file_mode == "w":
             out.write(
@@ -241,7 +232,7 @@ def main():
 
             # Exact solver
             exact_time, exact_len = avg_over_repeats(
-                EXACT_SCRIPT, path, EXACT_TIMEOUT, REPEATS,
+                islice(results, REPEATS), EXACT_TIMEOUT,
                 solver_name="exact", test_name=test_name, runs_log=runs_log
             )
             if exact_time >= EXACT_TIMEOUT * 0.9:  # Close to timeout
@@ -252,7 +243,7 @@ def main():
             print(f"  Running approx solver ({REPEATS} repeats, timeout={APPROX_TIMEOUT}s)...")
             # Approx solver
             approx_time, approx_len = avg_over_repeats(
-                APPROX_SCRIPT, path, APPROX_TIMEOUT, REPEATS,
+                islice(results, REPEATS), APPROX_TIMEOUT,
                 solver_name="approx", test_name=test_name, runs_log=runs_log
             )
             if approx_time >= APPROX_TIMEOUT * 0.9:
@@ -5,45 +5,96 @@ against all test cases and generate performance statistics.
 """
 
 import os
-import subprocess
 import csv
 import sys
 import json
-import statistics
+import hashlib
+import math
+import pickle
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
-def run_solution(script_path, test_file, timeout=300):
-    """Run a solution script on a test file and return the path length."""
+# orjson (optional) writes the results JSON much faster than json.dump and
+# produces the same bytes for it with OPT_INDENT_2
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
+
+# Both solvers run in-process (see part_D/solver_runner.py)
+sys.path.append(os.path.join(PROJECT_ROOT, "part_D"))
+from solver_runner import solve_length
+
+# Test files are independent, so they are analysed by this many processes
+ANALYSIS_WORKERS = os.cpu_count() or 1
+
+# (improved_length, exact_length) of earlier runs, keyed by test file content
+RESULTS_CACHE_FILE = os.path.join(SCRIPT_DIR, "improved_approx_results.cache.pkl")
+
+def analyze_one(test_path, improved_approx_script, exact_script):
+    """Run both solutions on one test file; returns (improved_length, exact_length)."""
+    improved_length = solve_length(improved_approx_script, test_path, timeout=30)
+    exact_length = solve_length(exact_script, test_path, timeout=120)
+    return improved_length, exact_length
+
+def content_digest(*paths):
+    """Return a BLAKE2b digest of the contents of the given files."""
+    h = hashlib.blake2b(digest_size=16)
+    for path in paths:
+        with open(path, 'rb') as f:
+            h.update(f.read())
+    return h.digest()
+
+def load_results_cache(solvers_key):
+    """
+    Load the {test digest: (improved_length, exact_length)} cache.
+    
+    The cache is pickled next to this script together with a digest of both
+    solver scripts, and is discarded as soon as either solver changes.
+    """
     try:
-        result = subprocess.run(
-            [sys.executable, script_path, test_file],
-            capture_output=True,
-            text=True,
-            timeout=timeout
-        )
-        
-        if result.returncode != 0:
-            return None
-        
-        lines = result.stdout.strip().split('\n')
-        if len(lines) < 1:
-            return None
-        
-        try:
-            path_length = int(lines[0])
-            return path_length
-        except ValueError:
-            return None
-    except subprocess.TimeoutExpired:
-        return None
-    except Exception as e:
-        print(f"Error running {script_path} on {test_file}: {e}", file=sys.stderr)
-        return None
+        with open(RESULTS_CACHE_FILE, 'rb') as f:
+            cached_key, cache = pickle.load(f)
+        if cached_key == solvers_key:
+            return cache
+    except (OSError, EOFError, TypeError, ValueError, pickle.UnpicklingError):
+        pass
+    return {}
+
+def save_results_cache(solvers_key, cache):
+    """Pickle the results cache for the next run."""
+    try:
+        with open(RESULTS_CACHE_FILE, 'wb') as f:
+            pickle.dump((solvers_key, cache), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass  # Cache is only an optimization
+
+def sorted_summary(values):
+    """
+    Return (sorted values, mean, median, sample stdev or None) for values.
+
+    One sort gives min/max (the ends) and the median; mean and stdev are
+    fsum-based float passes rather than statistics' exact-fraction ones.
+    """
+    ordered = sorted(values)
+    n = len(ordered)
+    mean = math.fsum(ordered) / n
+    half = n // 2
+    median = ordered[half] if n % 2 else (ordered[half - 1] + ordered[half]) / 2
+    stdev = None
+    if n > 1:
+        stdev = math.sqrt(math.fsum((x - mean) ** 2 for x in ordered) / (n - 1))
+    return ordered, mean, median, stdev
 
 def main():
     """Main analysis function."""
     # Get the directory where this script is located
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(script_dir)
+    script_dir = SCRIPT_DIR
+    project_root = PROJECT_ROOT
     
     test_dir = os.path.join(script_dir, "part_e_test_cases")
     exact_script = os.path.join(project_root, "exact_solution", "cs412_longestpath_exact.py")
@@ -61,8 +112,10 @@ def main():
         print(f"Error: Improved approximation script {improved_approx_script} not found!")
         return
     
-    # Get all test files
-    test_files = sorted([f for f in os.listdir(test_dir) if f.endswith('.txt')])
+    # Get all test files from one scandir pass (entry types come with the
+    # listing, so is_file() needs no extra stat)
+    with os.scandir(test_dir) as entries:
+        test_files = sorted(e.name for e in entries if e.name.endswith('.txt') and e.is_file())
     
     if not test_files:
         print(f"Error: No test files found in {test_dir}!")
@@ -76,41 +129,65 @@ def main():
     specific_test_cases = ['test_1026.txt', 'test_0895.txt', 'test_0931.txt', 'test_0936.txt', 'test_0941.txt']
     specific_results = []
     
-    for i, test_file in enumerate(test_files):
-        test_path = os.path.join(test_dir, test_file)
-        
-        if (i + 1) % 100 == 0:
-            print(f"Progress: {i + 1}/{len(test_files)} test cases processed...")
-        
-        # Run improved approximation solution
-        improved_length = run_solution(improved_approx_script, test_path, timeout=30)
-        
-        # Run exact solution
-        exact_length = run_solution(exact_script, test_path, timeout=120)
+    # Both solvers are deterministic, so a test whose contents (and solvers)
+    # are unchanged since an earlier run reuses that run's lengths
+    test_paths = [os.path.join(test_dir, test_file) for test_file in test_files]
+    solvers_key = content_digest(improved_approx_script, exact_script)
+    cache = load_results_cache(solvers_key)
+    digests = [content_digest(test_path) for test_path in test_paths]
+    cached = [cache.get(digest) for digest in digests]
+    to_run = [test_path for test_path, hit in zip(test_paths, cached) if hit is None]
+    if len(to_run) < len(test_paths):
+        print(f"Reusing cached results for {len(test_paths) - len(to_run)} unchanged test cases")
+        print()
+    
+    # Run both solutions on the remaining tests across a process pool; map()
+    # yields the lengths in test_files order as they finish, so progress,
+    # results and warnings keep that order. Tests are handed out in chunks
+    # of about a quarter of each worker's share, so task pickling and IPC
+    # are paid per chunk rather than per test
+    chunksize = max(1, len(to_run) // (4 * ANALYSIS_WORKERS))
+    with ProcessPoolExecutor(max_workers=ANALYSIS_WORKERS) as executor:
+        fresh = executor.map(analyze_one, to_run, repeat(improved_approx_script),
+                             repeat(exact_script), chunksize=chunksize)
         
-        if improved_length is not None and exact_length is not None:
-            ratio = improved_length / exact_length if exact_length > 0 else 0.0
-            percentage = ratio * 100
-            difference = exact_length - improved_length
+        for i, (test_file, digest, hit) in enumerate(zip(test_files, digests, cached)):
+            if hit is None:
+                improved_length, exact_length = next(fresh)
+                # Failures (e.g. timeouts) are retried on the next run
+                if improved_length is not None and exact_length is not None:
+                    cache[digest] = (improved_length, exact_length)
+            else:
+                improved_length, exact_length = hit
+            
+            if (i + 1) % 100 == 0:
+                print(f"Progress: {i + 1}/{len(test_files)} test cases processed...")
+            
+            if improved_length is not None and exact_length is not None:
+                ratio = improved_length / exact_length if exact_length > 0 else 0.0
+                percentage = ratio * 100
+                difference = exact_length - improved_length
             
-            result_entry = {
-                'test_file': test_file,
-                'improved_length': improved_length,
-                'exact_length': exact_length,
-                'ratio': ratio,
-                'percentage': percentage,
-                'difference': difference
-            }
+                result_entry = {
+                    'test_file': test_file,
+                    'improved_length': improved_length,
+                    'exact_length': exact_length,
+                    'ratio': ratio,
+                    'percentage': percentage,
+                    'difference': difference
+                }
             
-            results.append(result_entry)
+                results.append(result_entry)
             
-            # Store results for specific test cases
-            if test_file in specific_test_cases:
-                specific_results.append(result_entry)
-        elif improved_length is None:
-            print(f"Warning: Improved approximation failed on {test_file}", file=sys.stderr)
-        elif exact_length is None:
-            print(f"Warning: Exact solution failed on {test_file}", file=sys.stderr)
+                # Store results for specific test cases
+                if test_file in specific_test_cases:
+                    specific_results.append(result_entry)
+            elif improved_length is None:
+                print(f"Warning: Improved approximation failed on {test_file}", file=sys.stderr)
+            elif exact_length is None:
+                print(f"Warning: Exact solution failed on {test_file}", file=sys.stderr)
+    
+    save_results_cache(solvers_key, cache)
     
     print(f"\nSuccessfully processed {len(results)} test cases")
     
@@ -129,27 +206,33 @@ def main():
         print(f"Total test cases analyzed: {len(results)}")
         print(f"Cases where improved approximation found optimal: {optimal_count} ({optimal_count/len(results)*100:.2f}%)")
         print(f"\nPerformance Statistics (as percentage of optimal):")
-        print(f"  Minimum: {min(percentages):.2f}%")
-        print(f"  Maximum: {max(percentages):.2f}%")
-        print(f"  Mean: {statistics.mean(percentages):.2f}%")
-        print(f"  Median: {statistics.median(percentages):.2f}%")
-        if len(percentages) > 1:
-            print(f"  Standard Deviation: {statistics.stdev(percentages):.2f}%")
+        pct_sorted, pct_mean, pct_median, pct_stdev = sorted_summary(percentages)
+        print(f"  Minimum: {pct_sorted[0]:.2f}%")
+        print(f"  Maximum: {pct_sorted[-1]:.2f}%")
+        print(f"  Mean: {pct_mean:.2f}%")
+        print(f"  Median: {pct_median:.2f}%")
+        if pct_stdev is not None:
+            print(f"  Standard Deviation: {pct_stdev:.2f}%")
         
+        diff_sorted, diff_mean, diff_median, diff_stdev = sorted_summary(differences)
         print(f"\nDifference Statistics (Exact - Improved):")
-        print(f"  Minimum difference: {min(differences)}")
-        print(f"  Maximum difference: {max(differences)}")
-        print(f"  Mean difference: {statistics.mean(differences):.2f}")
-        print(f"  Median difference: {statistics.median(differences):.2f}")
-        if len(differences) > 1:
-            print(f"  Standard Deviation: {statistics.stdev(differences):.2f}")
+        print(f"  Minimum difference: {diff_sorted[0]}")
+        print(f"  Maximum difference: {diff_sorted[-1]}")
+        print(f"  Mean difference: {diff_mean:.2f}")
+        print(f"  Median difference: {diff_median:.2f}")
+        if diff_stdev is not None:
+            print(f"  Standard Deviation: {diff_stdev:.2f}")
         
-        # Performance buckets
-        perfect = sum(1 for p in percentages if p == 100.0)
-        excellent = sum(1 for p in percentages if 90.0 <= p < 100.0)
-        good = sum(1 for p in percentages if 80.0 <= p < 90.0)
-        fair = sum(1 for p in percentages if 70.0 <= p < 80.0)
-        poor = sum(1 for p in percentages if p < 70.0)
+        # Performance buckets, counted by bisecting the sorted percentages
+        below_70 = bisect_left(pct_sorted, 70.0)
+        below_80 = bisect_left(pct_sorted, 80.0)
+        below_90 = bisect_left(pct_sorted, 90.0)
+        below_100 = bisect_left(pct_sorted, 100.0)
+        perfect = bisect_right(pct_sorted, 100.0) - below_100
+        excellent = below_100 - below_90
+        good = below_90 - below_80
+        fair = below_80 - below_70
+        poor = below_70
         
         print(f"\nPerformance Distribution:")
         print(f"  100% (Optimal): {perfect} cases ({perfect/len(results)*100:.2f}%)")
@@ -189,8 +272,12 @@ def main():
     
     # Save full results to JSON for future reference
     json_file = os.path.join(script_dir, "improved_approx_full_results.json")
-    with open(json_file, 'w') as f:
-        json.dump(results, f, indent=2)
+    if orjson is not None:
+        with open(json_file, 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    else:
+        with open(json_file, 'w') as f:
+            json.dump(results, f, indent=2)
     
     print(f"\nFull results saved to: {json_file}")
     print("\nAnalysis complete!")
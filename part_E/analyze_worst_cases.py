@@ -5,49 +5,35 @@ Finds the 5 worst cases where approximation performs worst compared to exact sol
 """
 
 import os
-import subprocess
 import csv
+import heapq
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
-def run_solution(script_path, test_file, timeout=300):
-    """Run a solution script on a test file and return the path length."""
-    try:
-        result = subprocess.run(
-            [sys.executable, script_path, test_file],
-            capture_output=True,
-            text=True,
-            timeout=timeout
-        )
-        
-        if result.returncode != 0:
-            return None
-        
-        lines = result.stdout.strip().split('\n')
-        if len(lines) < 1:
-            return None
-        
-        try:
-            path_length = int(lines[0])
-            return path_length
-        except ValueError:
-            return None
-    except subprocess.TimeoutExpired:
-        return None
-    except Exception as e:
-        print(f"Error running {script_path} on {test_file}: {e}")
-        return None
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
+
+# Both solvers run in-process (see part_D/solver_runner.py)
+sys.path.append(os.path.join(PROJECT_ROOT, "part_D"))
+from solver_runner import solve_length
+
+# Test files are independent, so they are evaluated by this many processes
+ANALYSIS_WORKERS = os.cpu_count() or 1
+
+def evaluate_case(test_path, approx_script, exact_script):
+    """Run both solutions on one test file; returns (approx_length, exact_length)."""
+    approx_length = solve_length(approx_script, test_path, timeout=10)
+    exact_length = solve_length(exact_script, test_path, timeout=60)
+    return approx_length, exact_length
 
 def main():
     """Main analysis function."""
-    # Get the directory where this script is located
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(script_dir)
-    
-    test_dir = os.path.join(script_dir, "part_e_test_cases")
+    test_dir = os.path.join(SCRIPT_DIR, "part_e_test_cases")
     # Paths relative to project root (where run_comparison.py expects them)
-    exact_script = os.path.join(project_root, "exact_solution", "cs412_longestpath_exact.py")
-    approx_script = os.path.join(project_root, "approx_solution", "cs412_longestpath_approx.py")
+    exact_script = os.path.join(PROJECT_ROOT, "exact_solution", "cs412_longestpath_exact.py")
+    approx_script = os.path.join(PROJECT_ROOT, "approx_solution", "cs412_longestpath_approx.py")
     
     if not os.path.exists(test_dir):
         print(f"Error: Test directory {test_dir} not found!")
@@ -61,8 +47,10 @@ def main():
         print(f"Error: Approximation solution script {approx_script} not found!")
         return
     
-    # Get all test files
-    test_files = sorted([f for f in os.listdir(test_dir) if f.endswith('.txt')])
+    # Get all test files from one scandir pass (entry types come with the
+    # listing, so is_file() needs no extra stat)
+    with os.scandir(test_dir) as entries:
+        test_files = sorted(e.name for e in entries if e.name.endswith('.txt') and e.is_file())
     
     if not test_files:
         print(f"Error: No test files found in {test_dir}!")
@@ -74,41 +62,42 @@ def main():
     
     results = []
     
-    for i, test_file in enumerate(test_files):
-        test_path = os.path.join(test_dir, test_file)
-        
-        if (i + 1) % 100 == 0:
-            print(f"Progress: {i + 1}/{len(test_files)} test cases processed...")
-        
-        # Run approximation solution
-        approx_length = run_solution(approx_script, test_path, timeout=10)
+    # Evaluate every test across a process pool; map() yields the lengths in
+    # test_files order as they finish, so progress, results and warnings
+    # keep that order. Tests are handed out in chunks of about a quarter of
+    # each worker's share, so task pickling and IPC are paid per chunk
+    # rather than per test
+    test_paths = [os.path.join(test_dir, test_file) for test_file in test_files]
+    chunksize = max(1, len(test_paths) // (4 * ANALYSIS_WORKERS))
+    with ProcessPoolExecutor(max_workers=ANALYSIS_WORKERS) as executor:
+        lengths = executor.map(evaluate_case, test_paths, repeat(approx_script),
+                               repeat(exact_script), chunksize=chunksize)
         
-        # Run exact solution
-        exact_length = run_solution(exact_script, test_path, timeout=60)
-        
-        if approx_length is not None and exact_length is not None:
-            ratio = approx_length / exact_length if exact_length > 0 else 0.0
-            difference = exact_length - approx_length
+        for i, (test_file, (approx_length, exact_length)) in enumerate(zip(test_files, lengths)):
+            if (i + 1) % 100 == 0:
+                print(f"Progress: {i + 1}/{len(test_files)} test cases processed...")
             
-            results.append({
-                'test_file': test_file,
-                'approx_length': approx_length,
-                'exact_length': exact_length,
-                'ratio': ratio,
-                'difference': difference
-            })
-        elif approx_length is None:
-            print(f"Warning: Approximation failed on {test_file}")
-        elif exact_length is None:
-            print(f"Warning: Exact solution failed on {test_file}")
+            if approx_length is not None and exact_length is not None:
+                ratio = approx_length / exact_length if exact_length > 0 else 0.0
+                difference = exact_length - approx_length
+                
+                results.append({
+                    'test_file': test_file,
+                    'approx_length': approx_length,
+                    'exact_length': exact_length,
+                    'ratio': ratio,
+                    'difference': difference
+                })
+            elif approx_length is None:
+                print(f"Warning: Approximation failed on {test_file}")
+            elif exact_length is None:
+                print(f"Warning: Exact solution failed on {test_file}")
     
     print(f"\nSuccessfully processed {len(results)} test cases")
     
-    # Sort by worst performance (lowest ratio, then largest difference)
-    results.sort(key=lambda x: (x['ratio'], -x['difference']))
-    
-    # Get the 5 worst cases
-    worst_5 = results[:5]
+    # Get the 5 worst cases (lowest ratio, then largest difference); a
+    # partial selection, same order as sorting everything and slicing
+    worst_5 = heapq.nsmallest(5, results, key=lambda x: (x['ratio'], -x['difference']))
     
     print("\n5 Worst Performing Cases (by ratio):")
     print("-" * 80)
@@ -120,7 +109,7 @@ def main():
         print()
     
     # Write CSV for worst 5 approximation lengths
-    approx_csv_file = os.path.join(script_dir, "worst_5_approx_lengths.csv")
+    approx_csv_file = os.path.join(SCRIPT_DIR, "worst_5_approx_lengths.csv")
     with open(approx_csv_file, 'w', newline='') as f:
         writer = csv.writer(f)
         writer.writerow(['Test File', 'Approximation Length'])
@@ -130,7 +119,7 @@ def main():
     print(f"Created {approx_csv_file}")
     
     # Write CSV for worst 5 exact lengths
-    exact_csv_file = os.path.join(script_dir, "worst_5_exact_lengths.csv")
+    exact_csv_file = os.path.join(SCRIPT_DIR, "worst_5_exact_lengths.csv")
     with open(exact_csv_file, 'w', newline='') as f:
         writer = csv.writer(f)
         writer.writerow(['Test File', 'Exact Length'])
@@ -1,37 +1,59 @@
 #!/usr/bin/env python3
 """Compare baseline approximation vs improved on worst improved cases."""
 
+import asyncio
+import json
 import os
-import subprocess
 import sys
 import csv
 
-def run_solution(script_path, test_file, timeout=300):
+async def run_solution(script_path, test_file, timeout=300):
     """Run a solution script on a test file and return the path length."""
     try:
-        result = subprocess.run(
-            [sys.executable, script_path, test_file],
-            capture_output=True,
-            text=True,
-            timeout=timeout
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable, script_path, test_file,
+            stdout=asyncio.subprocess.PIPE,
+            # stderr is never read, so it is not buffered either
+            stderr=asyncio.subprocess.DEVNULL
         )
-        
-        if result.returncode != 0:
-            return None
-        
-        lines = result.stdout.strip().split('\n')
-        if len(lines) < 1:
-            return None
-        
+    except Exception as e:
+        return None
+    
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
         try:
-            path_length = int(lines[0])
-            return path_length
-        except ValueError:
-            return None
-    except subprocess.TimeoutExpired:
+            proc.kill()
+        except ProcessLookupError:
+            pass
+        await proc.wait()
         return None
-    except Exception as e:
+    
+    if proc.returncode != 0:
         return None
+    
+    # Only the first line (the path length) is needed: cut it out with find()
+    # instead of decoding and splitting the whole output, path included.
+    # int() accepts the bytes directly and ignores surrounding whitespace.
+    stdout = stdout.lstrip()
+    end = stdout.find(b'\n')
+    try:
+        return int(stdout[:end] if end >= 0 else stdout)
+    except ValueError:
+        return None
+
+async def run_all_solutions(jobs):
+    """
+    Run every (script_path, test_file, timeout) job concurrently, at most one
+    per CPU at a time, and return the path lengths in job order.
+    """
+    limit = asyncio.Semaphore(os.cpu_count() or 1)
+    
+    async def bounded(script_path, test_file, timeout):
+        async with limit:
+            return await run_solution(script_path, test_file, timeout)
+    
+    return await asyncio.gather(*(bounded(*job) for job in jobs))
 
 # Get paths
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -54,18 +76,24 @@ results = []
 print("Comparing Baseline vs Improved on Worst Improved Cases:")
 print("=" * 80)
 
+# Start the baseline and exact runs for all cases together rather than one
+# blocking subprocess after another
+jobs = []
 for test_file in worst_cases:
     test_path = os.path.join(test_dir, test_file)
+    jobs.append((baseline_script, test_path, 30))
+    jobs.append((exact_script, test_path, 120))
+lengths = asyncio.run(run_all_solutions(jobs))
+
+# Improved results from the full-results JSON, read once and keyed by test file
+with open(os.path.join(script_dir, 'improved_approx_full_results.json'), 'r') as f:
+    improved_by_file = {r['test_file']: r for r in json.load(f)}
+
+for i, test_file in enumerate(worst_cases):
+    baseline_length = lengths[2 * i]
+    exact_length = lengths[2 * i + 1]
     
-    baseline_length = run_solution(baseline_script, test_path, timeout=30)
-    exact_length = run_solution(exact_script, test_path, timeout=120)
-    
-    # Get improved results from JSON
-    import json
-    with open(os.path.join(script_dir, 'improved_approx_full_results.json'), 'r') as f:
-        improved_data = json.load(f)
-    
-    improved_result = next((r for r in improved_data if r['test_file'] == test_file), None)
+    improved_result = improved_by_file.get(test_file)
     improved_length = improved_result['improved_length'] if improved_result else None
     exact_length_from_json = improved_result['exact_length'] if improved_result else exact_length
     
@@ -13,116 +13,229 @@ locally optimal traps better than the basic greedy.
 """
 
 import sys
-from collections import defaultdict
+from itertools import islice
+from operator import itemgetter
+
+# Graphs up to this many vertices try every vertex as a start; larger ones
+# try only the CAPPED_STARTS vertices with the heaviest edges
+FULL_RESTART_LIMIT = 128
+CAPPED_STARTS = 64
 
 
 def read_graph(input_source):
     """Read graph from input file or stdin."""
     if isinstance(input_source, str):
-        f = open(input_source, 'r')
+        f = open(input_source, 'r', buffering=1 << 20)
         should_close = True
     else:
         f = input_source
         should_close = False
     
+    # One streaming pass: blank lines are skipped, the first line holds
+    # n and m, and the next m lines are edges
+    graph = {}
+    vertices = set()
+    
     try:
-        lines = [line.strip() for line in f if line.strip()]
+        lines = (line for line in f if not line.isspace())
+        first = next(lines, None)
+        if first is None:
+            return set(), {}
+        
+        n, m = map(int, first.split())
+        for line in islice(lines, m):
+            parts = line.split()
+            if len(parts) >= 3:
+                u, v = parts[0], parts[1]
+                w = float(parts[2])
+                vertices.add(u)
+                vertices.add(v)
+                graph.setdefault(u, {})[v] = w
+                graph.setdefault(v, {})[u] = w
     finally:
         if should_close:
             f.close()
     
-    if not lines:
-        return set(), {}
-    
-    n, m = map(int, lines[0].split())
-    graph = defaultdict(dict)
-    vertices = set()
-    
-    for i in range(1, min(m + 1, len(lines))):
-        parts = lines[i].split()
-        if len(parts) >= 3:
-            u, v = parts[0], parts[1]
-            w = float(parts[2])
-            vertices.add(u)
-            vertices.add(v)
-            graph[u][v] = w
-            graph[v][u] = w
-    
     return vertices, graph
 
 
-def greedy_lookahead_from_start(start, graph, vertices):
-    """Greedy longest-path with 1-step lookahead."""
-    visited = {start}
-    path = [start]
+def index_graph(vertices, graph):
+    """
+    Build the start-independent structures shared by every greedy walk.
+    
+    Returns (names, ids, adj, sorted_adj): vertex names in ID order, the
+    name -> ID table, per-ID adjacency lists of (neighbor ID, weight), and
+    their sorted_adjacency. IDs are dense and numbered in name order, so ID
+    comparisons break ties the same way name comparisons did.
+    """
+    names = sorted(vertices)
+    ids = {name: i for i, name in enumerate(names)}
+    adj = [[(ids[v], w) for v, w in graph[name].items()] for name in names]
+    return names, ids, adj, sorted_adjacency(adj)
+
+
+def sorted_adjacency(adj):
+    """
+    Map each vertex ID to its positive-weight edges as (neighbor, weight)
+    pairs, heaviest first.
+    
+    Non-positive edges are dropped, since the lookahead never counts a
+    future edge below 0.
+    """
+    sorted_adj = []
+    for edges in adj:
+        edges = sorted(edges, key=itemgetter(1), reverse=True)
+        sorted_adj.append([edge for edge in edges if edge[1] > 0])
+    return sorted_adj
+
+
+def path_length_bound(adj):
+    """
+    Upper bound on the length of any simple path: the sum of the |V|-1
+    heaviest positive edge weights, since such a path has at most |V|-1
+    edges, all distinct.
+    """
+    weights = sorted(
+        (w for u, edges in enumerate(adj) for v, w in edges if u < v and w > 0),
+        reverse=True,
+    )
+    return sum(weights[:len(adj) - 1])
+
+
+def greedy_lookahead_from_start(start, adj, sorted_adj, visited, path):
+    """
+    Greedy longest-path with 1-step lookahead, over integer vertex IDs.
+    
+    sorted_adj (from sorted_adjacency) lists each neighbor's edges heaviest
+    first, so its best future is the first entry leading to an unvisited
+    vertex, usually the very first one.
+    
+    visited (flags indexed by ID, all zero on entry) and path are scratch
+    buffers owned by the caller; the path is written to path[:depth] and
+    those vertices are left marked in visited.
+    
+    Returns:
+        (path_length, depth)
+    """
+    visited[start] = 1
+    path[0] = start
+    depth = 1
     current = start
     path_length = 0
     
     while True:
-        candidates = []
-
-        if current in graph:
-            for neighbor, w1 in graph[current].items():
-                if neighbor not in visited:
-                    
-                    # --- 1-Step Lookahead ---
-                    best_future = 0
-                    if neighbor in graph:
-                        for nxt, w2 in graph[neighbor].items():
-                            if nxt not in visited and nxt != current:
-                                if w2 > best_future:
-                                    best_future = w2
-
-                    score = w1 + best_future
-                    # Store tuple so tie-breakers fall back to immediate weight
-                    candidates.append((score, w1, neighbor))
-
-        if not candidates:
+        # Best (score, w1, neighbor) so far, tracked in one pass; comparing
+        # whole tuples keeps the old sort's tie-breaks (w1, then name, as
+        # IDs are numbered in name order)
+        best = None
+
+        for neighbor, w1 in adj[current]:
+            if not visited[neighbor]:
+                
+                # --- 1-Step Lookahead ---
+                # current is already in visited, so it is skipped too
+                best_future = 0
+                for nxt, w2 in sorted_adj[neighbor]:
+                    if not visited[nxt]:
+                        best_future = w2
+                        break
+
+                score = w1 + best_future
+                candidate = (score, w1, neighbor)
+                if best is None or candidate > best:
+                    best = candidate
+
+        if best is None:
             break
 
-        # Choose the candidate with best score (and best w1 if tie)
-        candidates.sort(reverse=True)
-        _, chosen_weight, chosen_neighbor = candidates[0]
+        _, chosen_weight, chosen_neighbor = best
         
-        visited.add(chosen_neighbor)
-        path.append(chosen_neighbor)
+        visited[chosen_neighbor] = 1
+        path[depth] = chosen_neighbor
+        depth += 1
         path_length += chosen_weight
         current = chosen_neighbor
     
-    return path_length, path
+    return path_length, depth
+
+
+def start_vertices(vertices, ids, sorted_adj, max_starts=None):
+    """
+    Yield the start vertex IDs to try.
+    
+    Small graphs (at most FULL_RESTART_LIMIT vertices, unless max_starts is
+    given) try every vertex. Otherwise only the max_starts vertices with the
+    heaviest incident edge are tried, heaviest first, defaulting to
+    CAPPED_STARTS.
+    """
+    n = len(sorted_adj)
+    if max_starts is None:
+        max_starts = n if n <= FULL_RESTART_LIMIT else CAPPED_STARTS
+    if max_starts >= n:
+        for start in vertices:
+            yield ids[start]
+        return
+    
+    top_weight = [edges[0][1] if edges else 0 for edges in sorted_adj]
+    yield from sorted(range(n), key=top_weight.__getitem__, reverse=True)[:max_starts]
 
 
-def find_longest_path_approx(vertices, graph):
-    """Try each vertex as a start and take the best path."""
+def find_longest_path_approx(vertices, graph, max_starts=None):
+    """
+    Try each vertex given by start_vertices as a start and take the best
+    path.
+    """
     if not vertices:
         return 0, []
     
+    # Built once per graph and shared by all starts
+    names, ids, adj, sorted_adj = index_graph(vertices, graph)
+    bound = path_length_bound(adj)
+    
+    # Scratch buffers shared by every greedy run; only the entries a run
+    # touched are cleared afterwards
+    visited = [0] * len(adj)
+    path = [0] * len(adj)
+    
     max_length = 0
     best_path = []
     
-    for start in vertices:
-        length, path = greedy_lookahead_from_start(start, graph, vertices)
+    for start in start_vertices(vertices, ids, sorted_adj, max_starts):
+        length, depth = greedy_lookahead_from_start(start, adj, sorted_adj, visited, path)
         if length > max_length:
             max_length = length
-            best_path = path
+            best_path = path[:depth]
+            # No later start can strictly beat a path that meets the bound
+            if max_length >= bound:
+                break
+        for v in path[:depth]:
+            visited[v] = 0
     
-    return max_length, best_path
+    return max_length, [names[i] for i in best_path]
 
 
-def main():
-    """Main driver."""
-    input_source = sys.argv[1] if len(sys.argv) > 1 else sys.stdin
-    
+def solve(input_source):
+    """
+    Read a graph and return (max_length, path) for the lookahead greedy
+    path, with max_length as an int and path as a list of vertex names.
+    Used by the analysis scripts to run the solver in-process.
+    """
     vertices, graph = read_graph(input_source)
     
     if not vertices:
-        print(0)
-        print()
-        return
+        return 0, []
     
     max_length, best_path = find_longest_path_approx(vertices, graph)
+    return int(max_length), best_path
+
+
+def main():
+    """Main driver."""
+    input_source = sys.argv[1] if len(sys.argv) > 1 else sys.stdin
+    
+    max_length, best_path = solve(input_source)
     
-    print(f"{int(max_length)}")
+    print(max_length)
     print(" ".join(best_path))
 
 
@@ -13,23 +13,43 @@ Test case types:
 7. Random graphs with various properties
 """
 
+import functools
 import random
 import os
+import sys
 import itertools
 from collections import defaultdict
 
+# The edge sampling is shared with the other generators in part_D
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "part_D"))
+from graph_sampling import sample_pairs
+
+@functools.lru_cache(maxsize=None)
+def vertex_names(prefix, n):
+    """Return the names prefix1..prefixn; cached because the same sizes recur constantly."""
+    return tuple(f"{prefix}{i}" for i in range(1, n + 1))
+
+def random_weights(count, weight_range):
+    """
+    Draw count integer weights uniformly from weight_range (inclusive).
+    
+    Uses randrange(low, high + 1), which is exactly what randint calls, so the
+    random stream (and every generated test case) matches drawing one weight
+    per edge with random.randint.
+    """
+    randrange = random.randrange
+    low, high = weight_range[0], weight_range[1] + 1
+    return [randrange(low, high) for _ in range(count)]
+
 def generate_complete_graph(n, weight_range=(1, 100), seed=None):
     """Generate a complete graph with n vertices."""
     if seed is not None:
         random.seed(seed)
     
-    vertices = [f"v{i}" for i in range(1, n + 1)]
-    edges = []
-    
-    for i in range(n):
-        for j in range(i + 1, n):
-            weight = random.randint(weight_range[0], weight_range[1])
-            edges.append((vertices[i], vertices[j], weight))
+    vertices = vertex_names("v", n)
+    pairs = list(itertools.combinations(vertices, 2))
+    weights = random_weights(len(pairs), weight_range)
+    edges = [(u, v, w) for (u, v), w in zip(pairs, weights)]
     
     return vertices, edges
 
@@ -38,16 +58,17 @@ def generate_tree_graph(n, weight_range=(1, 100), seed=None):
     if seed is not None:
         random.seed(seed)
     
-    vertices = [f"v{i}" for i in range(1, n + 1)]
+    vertices = vertex_names("v", n)
     edges = []
-    used = {vertices[0]}
+    randrange = random.randrange
     
+    # Vertex i attaches to one of the vertices already in the tree, which are
+    # exactly vertices[:i]
     for i in range(1, n):
-        u = random.choice(list(used))
+        u = vertices[randrange(i)]
         v = vertices[i]
         weight = random.randint(weight_range[0], weight_range[1])
         edges.append((u, v, weight))
-        used.add(v)
     
     return vertices, edges
 
@@ -56,12 +77,9 @@ def generate_path_graph(n, weight_range=(1, 100), seed=None):
     if seed is not None:
         random.seed(seed)
     
-    vertices = [f"v{i}" for i in range(1, n + 1)]
-    edges = []
-    
-    for i in range(n - 1):
-        weight = random.randint(weight_range[0], weight_range[1])
-        edges.append((vertices[i], vertices[i + 1], weight))
+    vertices = vertex_names("v", n)
+    weights = random_weights(n - 1, weight_range)
+    edges = list(zip(vertices, vertices[1:], weights))
     
     return vertices, edges
 
@@ -70,12 +88,10 @@ def generate_cycle_graph(n, weight_range=(1, 100), seed=None):
     if seed is not None:
         random.seed(seed)
     
-    vertices = [f"v{i}" for i in range(1, n + 1)]
-    edges = []
-    
-    for i in range(n):
-        weight = random.randint(weight_range[0], weight_range[1])
-        edges.append((vertices[i], vertices[(i + 1) % n], weight))
+    vertices = vertex_names("v", n)
+    weights = random_weights(n, weight_range)
+    # Successor of each vertex, wrapping the last one back to the first
+    edges = list(zip(vertices, vertices[1:] + vertices[:1], weights))
     
     return vertices, edges
 
@@ -87,13 +103,11 @@ def generate_sparse_graph(n, m, weight_range=(1, 100), seed=None):
     if m > n * (n - 1) // 2:
         m = n * (n - 1) // 2
     
-    vertices = [f"v{i}" for i in range(1, n + 1)]
-    possible_edges = [(vertices[i], vertices[j]) 
-                      for i in range(n) for j in range(i + 1, n)]
+    vertices = vertex_names("v", n)
     
-    selected_edges = random.sample(possible_edges, m)
-    edges = [(u, v, random.randint(weight_range[0], weight_range[1])) 
-             for u, v in selected_edges]
+    selected_edges = sample_pairs(random, n, m, vertices)
+    weights = random_weights(m, weight_range)
+    edges = [(u, v, w) for (u, v), w in zip(selected_edges, weights)]
     
     return vertices, edges
 
@@ -106,35 +120,54 @@ def generate_dense_graph(n, density=0.7, weight_range=(1, 100), seed=None):
     m = int(max_edges * density)
     return generate_sparse_graph(n, m, weight_range, seed)
 
-def generate_greedy_trap_graph(n, seed=None):
-    """
-    Generate a graph designed to trick greedy algorithms.
-    Creates a structure where greedy choice early leads to suboptimal path.
+@functools.lru_cache(maxsize=None)
+def greedy_trap_skeleton(n):
     """
-    if seed is not None:
-        random.seed(seed)
+    Return the fixed part of the greedy-trap topology for n vertices.
     
-    vertices = [f"v{i}" for i in range(1, n + 1)]
-    edges = []
+    Gives (fixed_edges, random_pairs): the weighted trap/chain edges, and the
+    (u, v) pairs that get a random weight in 10..50 on every call.
+    """
+    vertices = vertex_names("v", n)
+    fixed_edges = []
+    random_pairs = []
     
     # Create a structure: start -> high-weight edge -> dead end
     # vs start -> medium edges -> longer path with more total weight
     if n >= 4:
         # High weight edge that looks attractive but leads to dead end
-        edges.append((vertices[0], vertices[1], 100))
-        edges.append((vertices[1], vertices[2], 1))  # Dead end
+        fixed_edges.append((vertices[0], vertices[1], 100))
+        fixed_edges.append((vertices[1], vertices[2], 1))  # Dead end
         
         # Alternative path: multiple medium edges that sum to more
-        edges.append((vertices[0], vertices[3], 30))
+        fixed_edges.append((vertices[0], vertices[3], 30))
         for i in range(3, min(n, 6)):
             if i + 1 < n:
-                edges.append((vertices[i], vertices[i + 1], 30))
+                fixed_edges.append((vertices[i], vertices[i + 1], 30))
         
         # Add more connections to make it interesting
         for i in range(4, n):
             for j in range(i + 1, min(i + 3, n)):
-                weight = random.randint(10, 50)
-                edges.append((vertices[i], vertices[j], weight))
+                random_pairs.append((vertices[i], vertices[j]))
+    
+    return tuple(fixed_edges), tuple(random_pairs)
+
+def generate_greedy_trap_graph(n, seed=None):
+    """
+    Generate a graph designed to trick greedy algorithms.
+    Creates a structure where greedy choice early leads to suboptimal path.
+    """
+    if seed is not None:
+        random.seed(seed)
+    
+    vertices = vertex_names("v", n)
+    fixed_edges, random_pairs = greedy_trap_skeleton(n)
+    
+    # Only the extra connections are random; their weights are drawn in the
+    # same order as before, so the random stream is unchanged.
+    weights = random_weights(len(random_pairs), (10, 50))
+    edges = list(fixed_edges)
+    edges.extend((u, v, w) for (u, v), w in zip(random_pairs, weights))
     
     return vertices, edges
 
@@ -143,13 +176,11 @@ def generate_star_graph(n, weight_range=(1, 100), seed=None):
     if seed is not None:
         random.seed(seed)
     
-    vertices = [f"v{i}" for i in range(1, n + 1)]
-    edges = []
+    vertices = vertex_names("v", n)
     
     center = vertices[0]
-    for i in range(1, n):
-        weight = random.randint(weight_range[0], weight_range[1])
-        edges.append((center, vertices[i], weight))
+    weights = random_weights(n - 1, weight_range)
+    edges = [(center, v, w) for v, w in zip(vertices[1:], weights)]
     
     return vertices, edges
 
@@ -158,17 +189,19 @@ def generate_bipartite_graph(n1, n2, m, weight_range=(1, 100), seed=None):
     if seed is not None:
         random.seed(seed)
     
-    vertices1 = [f"a{i}" for i in range(1, n1 + 1)]
-    vertices2 = [f"b{i}" for i in range(1, n2 + 1)]
+    vertices1 = vertex_names("a", n1)
+    vertices2 = vertex_names("b", n2)
     vertices = vertices1 + vertices2
     
-    possible_edges = [(u, v) for u in vertices1 for v in vertices2]
-    if m > len(possible_edges):
-        m = len(possible_edges)
+    num_pairs = n1 * n2
+    if m > num_pairs:
+        m = num_pairs
     
-    selected_edges = random.sample(possible_edges, m)
-    edges = [(u, v, random.randint(weight_range[0], weight_range[1])) 
-             for u, v in selected_edges]
+    # Position k in the row-major (vertices1 x vertices2) pair list
+    selected_edges = [(vertices1[k // n2], vertices2[k % n2])
+                      for k in random.sample(range(num_pairs), m)]
+    weights = random_weights(m, weight_range)
+    edges = [(u, v, w) for (u, v), w in zip(selected_edges, weights)]
     
     return vertices, edges
 
@@ -181,10 +214,10 @@ def write_test_case(filename, vertices, edges):
     n = len(vertices)
     m = len(edges)
     
+    # Build the whole file first and write it in one call
+    body = f"{n} {m}\n" + "".join([f"{u} {v} {w}\n" for u, v, w in edges])
     with open(filename, 'w') as f:
-        f.write(f"{n} {m}\n")
-        for u, v, w in edges:
-            f.write(f"{u} {v} {w}\n")
+        f.write(body)
 
 def main():
     """Generate 1000+ test cases."""
@@ -8,11 +8,23 @@ References:
 - NumPy documentation: https://numpy.org/doc/stable/
 """
 
+import csv
 import os
 import sys
 
+# No display to show plots on (a Linux box without X11 or Wayland, e.g. CI
+# or ssh): use the non-interactive Agg backend, which avoids importing a GUI
+# toolkit, and only save the files. An explicit MPLBACKEND still wins.
+HEADLESS = (sys.platform.startswith('linux')
+            and not os.environ.get('DISPLAY')
+            and not os.environ.get('WAYLAND_DISPLAY')
+            and not os.environ.get('MPLBACKEND'))
+
 # Try to import matplotlib
 try:
+    import matplotlib
+    if HEADLESS:
+        matplotlib.use('Agg')
     import matplotlib.pyplot as plt
     import numpy as np
     HAS_MATPLOTLIB = True
@@ -24,6 +36,17 @@ except ImportError:
     print("")
     print("The script will still display the data in text format.")
 
+def parse_speedup(field):
+    """Speedup column: a float, or None when the script recorded N/A."""
+    return float(field) if field != "N/A" else None
+
+# Columns of comparison_data.txt, in file order, with their parsers
+FIELDS = ('test_name', 'vertices', 'edges', 'exact_time', 'approx_time',
+          'exact_value', 'approx_value', 'quality', 'difference',
+          'percent_diff', 'speedup')
+FIELD_TYPES = (str, int, int, float, float, int, int, str, int, float,
+               parse_speedup)
+
 def read_comparison_data(filename):
     """Read comparison data from file."""
     data = []
@@ -33,43 +56,20 @@ def read_comparison_data(filename):
         print("Please run compare_solutions_detailed.sh first.")
         sys.exit(1)
     
-    with open(filename, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('#'):
+    with open(filename, 'r', newline='') as f:
+        # Skip blank and comment lines, then let the C csv reader split the
+        # pipe-delimited fields (no quoting, exactly like str.split('|'))
+        lines = (line.strip() for line in f)
+        rows = csv.reader((line for line in lines if line and not line.startswith('#')),
+                          delimiter='|', quoting=csv.QUOTE_NONE)
+        for parts in rows:
+            if len(parts) < 11:
+                continue
+            try:
+                values = [convert(field) for convert, field in zip(FIELD_TYPES, parts)]
+            except ValueError:
                 continue
-            
-            parts = line.split('|')
-            if len(parts) >= 11:
-                try:
-                    test_name = parts[0]
-                    vertices = int(parts[1])
-                    edges = int(parts[2])
-                    exact_time = float(parts[3])
-                    approx_time = float(parts[4])
-                    exact_value = int(parts[5])
-                    approx_value = int(parts[6])
-                    quality = parts[7]
-                    difference = int(parts[8])
-                    percent_diff = float(parts[9])
-                    speedup_str = parts[10] if len(parts) > 10 else "N/A"
-                    speedup = float(speedup_str) if speedup_str != "N/A" else None
-                    
-                    data.append({
-                        'test_name': test_name,
-                        'vertices': vertices,
-                        'edges': edges,
-                        'exact_time': exact_time,
-                        'approx_time': approx_time,
-                        'exact_value': exact_value,
-                        'approx_value': approx_value,
-                        'quality': quality,
-                        'difference': difference,
-                        'percent_diff': percent_diff,
-                        'speedup': speedup
-                    })
-                except (ValueError, IndexError):
-                    continue
+            data.append(dict(zip(FIELDS, values)))
     
     return data
 
@@ -197,7 +197,8 @@ def plot_comparison(data):
     print(f"  - {output_png}")
     print(f"  - {output_pdf}")
     
-    plt.show()
+    if not HEADLESS:
+        plt.show()
 
 def main():
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -9,11 +9,17 @@ to reach 80 edges as requested.
 
 import random
 import os
+import sys
+
+# The edge sampling is shared with the other generators in part_D
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "part_D"))
+from graph_sampling import sample_weighted_edges
 
 def generate_sparse_graph(n, m, weight_range=(1, 100), seed=None):
     """Generate a sparse graph with n vertices and m edges."""
-    if seed is not None:
-        random.seed(seed)
+    # A private generator seeded the same way produces the same sequence as
+    # the seeded global one, without changing the global random state
+    rng = random.Random(seed)
     
     # Ensure m doesn't exceed maximum possible edges
     max_edges = n * (n - 1) // 2
@@ -21,12 +27,8 @@ def generate_sparse_graph(n, m, weight_range=(1, 100), seed=None):
         m = max_edges
     
     vertices = [f"v{i}" for i in range(1, n + 1)]
-    possible_edges = [(vertices[i], vertices[j]) 
-                      for i in range(n) for j in range(i + 1, n)]
     
-    selected_edges = random.sample(possible_edges, m)
-    edges = [(u, v, random.randint(weight_range[0], weight_range[1])) 
-             for u, v in selected_edges]
+    edges = sample_weighted_edges(rng, n, m, vertices, weight_range)
     
     return vertices, edges
 
@@ -35,10 +37,12 @@ def write_test_case(filename, vertices, edges):
     n = len(vertices)
     m = len(edges)
     
+    # Build the whole file first and write it in one call rather than one
+    # write per edge
+    lines = [f"{n} {m}"]
+    lines.extend([f"{u} {v} {w}" for u, v, w in edges])
     with open(filename, 'w') as f:
-        f.write(f"{n} {m}\n")
-        for u, v, w in edges:
-            f.write(f"{u} {v} {w}\n")
+        f.write("\n".join(lines) + "\n")
 
 def main():
     """Generate 10 test cases for timing tests."""